@@ -1,2 +1,2 @@
-from classes.graphs import *
+from .classes.graphs import *
 
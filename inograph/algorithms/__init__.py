@@ -1,5 +1,5 @@
-from coloring.EdgeColoring import *
-from coloring.VertexColoring import *
-from spanning.BFS import *
-from spanning.DFS import *
-from spanning.Dijkstra import *
+from .coloring.EdgeColoring import *
+from .coloring.VertexColoring import *
+from .spanning.BFS import *
+from .spanning.DFS import *
+from .spanning.Dijkstra import *
@@ -1,6 +1,5 @@
 import itertools
 import sys
-from scipy.optimize import linear_sum_assignment
 import numpy as np
 from inograph.classes.graphs.BipartiteGraph import BipartiteGraph
 
@@ -10,6 +9,7 @@ def MinimumWeightMaxMatching(g: BipartiteGraph):
     :param g: BipartiteGraph type each edge contains Weight property type vector
     :return: matches dictionary - {sourceID : targetID} , unmatched vertices list
     """
+    from scipy.optimize import linear_sum_assignment
     matches, unmatched = {}, []
     weights = __costMatrix(g, A := {i: v for i, v in enumerate(sorted(list(g.GetLeftSet)))},
                               B := {i: v for i, v in enumerate(sorted(list(g.GetRightSet)))})
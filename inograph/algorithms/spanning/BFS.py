@@ -1,31 +1,61 @@
+from collections import deque
+from inograph.classes.graphs.FrozenGraph import FrozenGraph
 from inograph.classes.graphs.Graph import Graph
+from inograph.algorithms.spanning.Paths import Paths
+from inograph.algorithms.spanning.Parallel import SearchSources
+from inograph.algorithms.spanning.CSGraph import CSGraphBFS
 
 
-def BFS(g: Graph, fromSet, *, directed='None'):
+def BFS(g: Graph, fromSet, *, directed='None', workers: int = None, backend: str = 'python'):
     """
-    :param g: Graph type
+    :param g: Graph type, or a FrozenGraph snapshot of a graph. A graph is frozen for the search
     :param fromSet: set of the sources' IDs
     :param directed: 'Into' (all path into source vertex) / 'From' (all paths from source vertex) / None (indirect)
-    :return: paths dictionary - {sourceID : {targetID [path to the target-edges list)]}
+    :param workers: optional, number of processes the sources are split across, see SearchSources. Default is the current process only
+    :param backend: 'python' / 'csgraph' to search with scipy.sparse.csgraph, whose adjacency matrix is kept until the graph is mutated
+    :return: paths dictionary - {sourceID : Paths {targetID [path to the target-edges list)]}}, paths are built when read
     """
-    EdgesSubsetType = {'Into': 'IncomingEdgeList', 'From': 'OutgoingEdgeList', 'None': 'AdjacentEdgeList'}[directed]
-    def reversePath(path):
-        path.reverse()
-        return path
-    return {v.ID: {k: (reversePath(path) if directed == 'Into' else path) for k, path in
-                   __BFS(g, v.ID, EdgesSubsetType).items()} for v in fromSet}
+    if backend == 'csgraph': return CSGraphBFS(g, [v.ID for v in fromSet], directed)
+    if backend != 'python': raise Exception(f"Unknown backend {backend}, use 'python' or 'csgraph'.")
+    g = g if isinstance(g, FrozenGraph) else g.Freeze()
+    sources = [g.VertexIndex[v.ID] for v in fromSet]
+    results = SearchSources(__BFSParents, g.CSR(directed), sources, workers=workers)
+    return {g.VertexIDs[src]: Paths(g, src, parents, reverse=directed == 'Into') for src, parents in zip(sources, results)}
 
 
-def __BFS(g: Graph, srcID, EdgesSubsetType):
-    visited = {key: False for key in g.Vertices.keys()}
-    pathList, queue = {}, [srcID]
-    visited[srcID] = True
+def BFSOrder(g: Graph, sourceID, *, directed='None'):
+    """
+    Yields the vertices reached from the source in breadth first order, without building any path.
+    :param g: Graph type, or a FrozenGraph snapshot of a graph. A graph is frozen for the search
+    :param directed: 'Into' / 'From' / None, as in BFS
+    :return: generator of (vertexID, parentID, edgeID) - the vertex, the vertex it was reached from and the edge between them, the source excluded
+    """
+    g = g if isinstance(g, FrozenGraph) else g.Freeze()
+    indptr, indices, edges = (a.tolist() for a in g.CSR(directed))
+    vertexIDs, edgeIDs = g.VertexIDs, g.EdgeIDs
+    for u, w, k in __BFS(indptr, indices, g.VertexIndex[sourceID]):
+        yield vertexIDs[w], vertexIDs[u], edgeIDs[edges[k]]
+
+
+def __BFSParents(csr, src):
+    """
+    :return: parents - {vertex index: (parent vertex index, edge index)} of every vertex reached from src
+    """
+    indptr, indices, edges = csr
+    return {w: (u, edges[k]) for u, w, k in __BFS(indptr, indices, src)}
+
+
+def __BFS(indptr, indices, src):
+    """
+    :return: generator of (parent index, vertex index, CSR position of the edge) of every vertex reached, in breadth first order
+    """
+    visited = [False] * (len(indptr) - 1)
+    queue = deque([src])
+    visited[src] = True
     while queue:
-        vID = queue.pop(0)
-        for edge in getattr(g, EdgesSubsetType)(vID):
-            neighbor = edge.Source if edge.Source.ID != vID else edge.Target
-            if not visited[neighbor.ID]:
-                queue.append(neighbor.ID)
-                visited[neighbor.ID] = True
-                pathList[neighbor.ID] = [edge.ID] if pathList.get(vID) is None else pathList[vID] + [edge.ID]
-    return pathList
+        v = queue.popleft()
+        for k in range(indptr[v], indptr[v + 1]):
+            if not visited[neighbor := indices[k]]:
+                visited[neighbor] = True
+                queue.append(neighbor)
+                yield v, neighbor, k
@@ -0,0 +1,108 @@
+import weakref
+import numpy as np
+from inograph.classes.graphs.FrozenGraph import FrozenGraph
+from inograph.algorithms.spanning.Paths import Paths
+
+__snapshots = weakref.WeakKeyDictionary()  # {Graph: (revision, FrozenGraph, cache)}, {FrozenGraph: (None, None, cache)}
+
+
+def CSGraphSnapshot(g):
+    """
+    :return: (frozen, cache) - the FrozenGraph of g and the cache of its vertex pairs and unweighted matrices. Both are kept until g is
+             mutated, so repeated searches on an unchanged graph neither freeze it nor rebuild its adjacency again
+    """
+    if isinstance(g, FrozenGraph): return g, __snapshots.setdefault(g, (None, None, {}))[2]
+    if (snapshot := __snapshots.get(g)) is None or snapshot[0] != g._revision:
+        snapshot = __snapshots[g] = (g._revision, g.Freeze(), {})
+    return snapshot[1:]
+
+
+def CSGraphBFS(g, sources, directed='None'):
+    """
+    Breadth first search with scipy.sparse.csgraph.breadth_first_order. Parallel edges are searched once, through the first of them.
+    :param g: Graph type, or a FrozenGraph snapshot of a graph
+    :param sources: list of the sources' IDs
+    :return: paths dictionary - {sourceID : Paths {targetID [path to the target-edges list)]}}
+    """
+    from scipy.sparse.csgraph import breadth_first_order
+    frozen, cache = CSGraphSnapshot(g)
+    matrix, keys, pairEdges = __matrix(frozen, cache, directed)
+    paths = {}
+    for sourceID in sources:
+        src = frozen.VertexIndex[sourceID]
+        order, predecessors = breadth_first_order(matrix, src, directed=True, return_predecessors=True)
+        parents = __parents(order[1:], predecessors, keys, pairEdges, len(frozen.VertexIDs))
+        paths[sourceID] = Paths(frozen, src, parents, reverse=directed == 'Into')
+    return paths
+
+
+def CSGraphDijkstra(g, sources, weights, directed='None', targets=None):
+    """
+    Dijkstra's search with scipy.sparse.csgraph.dijkstra. Of parallel edges, only the lightest is searched.
+    :param g: Graph type, or a FrozenGraph snapshot of a graph
+    :param sources: list of the sources' IDs
+    :param weights: function from the FrozenGraph of g to the array of the weight of every edge, aligned with its EdgeIDs.
+                    Weights are read on every search, only the adjacency is cached
+    :param targets: optional, set of the targets' IDs whose paths are returned
+    :return: paths dictionary - {sourceID : Paths {targetID [path to the target-edges list)]}}
+    """
+    from scipy.sparse.csgraph import dijkstra
+    frozen, cache = CSGraphSnapshot(g)
+    matrix, keys, pairEdges = __matrix(frozen, cache, directed, np.asarray(weights(frozen), dtype=float))
+    if targets is not None: targets = [frozen.VertexIndex[ID] for ID in targets]
+    paths = {}
+    for sourceID in sources:
+        src = frozen.VertexIndex[sourceID]
+        distances, predecessors = dijkstra(matrix, directed=True, indices=src, return_predecessors=True)
+        reached = np.argsort(distances, kind='stable')[:np.isfinite(distances).sum()]
+        parents = __parents(reached[reached != src], predecessors, keys, pairEdges, len(frozen.VertexIDs))
+        paths[sourceID] = Paths(frozen, src, parents, reverse=directed == 'Into', targets=targets)
+    return paths
+
+
+def __pairs(frozen: FrozenGraph, cache, directed):
+    """
+    :return: (rows, columns, edges, keys) of the adjacency, ordered by vertex pair (row, column) and by the order of the
+             graph within a pair, keys being row * len(VertexIDs) + column
+    """
+    if (pairs := cache.get(directed)) is None:
+        indptr, indices, edges = frozen.CSR(directed)
+        rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+        keys = rows * len(frozen.VertexIDs) + indices
+        order = np.argsort(keys, kind='stable')
+        pairs = cache[directed] = (rows[order], indices[order], edges[order], keys[order])
+    return pairs
+
+
+def __matrix(frozen: FrozenGraph, cache, directed, weights=None):
+    """
+    :param weights: optional, the weight of every edge. Otherwise the first edge of every pair is kept, and the matrix is cached
+    :return: (matrix, keys, pairEdges) - csr_matrix of the lightest edge of every vertex pair, the sorted keys of its pairs
+             and the index of the edge kept for every pair
+    """
+    from scipy.sparse import csr_matrix
+    if weights is None and (matrix := cache.get(('Matrix', directed))) is not None: return matrix
+    rows, columns, edges, keys = __pairs(frozen, cache, directed)
+    if weights is None: data = np.ones(len(edges))
+    else:
+        order = np.lexsort((weights[edges], keys))
+        rows, columns, edges, keys = rows[order], columns[order], edges[order], keys[order]
+        data = weights[edges]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    rows, columns, edges, keys, data = rows[first], columns[first], edges[first], keys[first], data[first]
+    n = len(frozen.VertexIDs)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    matrix = csr_matrix((data, columns, indptr), shape=(n, n)), keys, edges
+    if weights is None: cache[('Matrix', directed)] = matrix
+    return matrix
+
+
+def __parents(reached, predecessors, keys, pairEdges, n):
+    """
+    :return: parents - {vertex index: (parent vertex index, edge index)} of the reached vertices, in their order
+    """
+    parentVertices = predecessors[reached].astype(np.int64)
+    parentEdges = pairEdges[np.searchsorted(keys, parentVertices * n + reached)]
+    return dict(zip(reached.tolist(), zip(parentVertices.tolist(), parentEdges.tolist())))
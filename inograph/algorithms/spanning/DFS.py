@@ -1,33 +1,61 @@
+from inograph.classes.graphs.FrozenGraph import FrozenGraph
 from inograph.classes.graphs.Graph import Graph
+from inograph.algorithms.spanning.Paths import Paths
+from inograph.algorithms.spanning.Parallel import SearchSources
 
 
-def DFS(g: Graph, fromSet, directed='None'):
+def DFS(g: Graph, fromSet, directed='None', *, workers: int = None):
     """
-    :param g: Graph type
+    :param g: Graph type, or a FrozenGraph snapshot of a graph. A graph is frozen for the search
     :param fromSet: set of the sources id's
     :param directed: 'Into' (all path into source vertex) / 'From' (all paths from source vertex) / None (indirect)
-    :return: paths dictionary - {sourceID : {targetID [path to the target-edges list)]}
-    """
-    EdgesSubsetType = {'Into': 'IncomingEdgeList', 'From': 'OutgoingEdgeList', 'None': 'AdjacentEdgeList'}[directed]
-    def reversePath(path):
-        path.reverse()
-        return path
-    return {v.ID: {k: (reversePath(path) if directed == 'Into' else path) for k, path in
-                   __DFS(g, v.ID, EdgesSubsetType).items()} for v in fromSet}
-
-
-def __DFS(g: Graph, srcID, EdgesSubsetType):
-    visited = {key: False for key in g.Vertices.keys()}
-    pathList, queue = {}, [srcID]
-    visited[srcID] = True
-    def rec(vID):
-        for edge in getattr(g, EdgesSubsetType)(vID):
-            neighbor = edge.Source if edge.Source.ID != vID else edge.Target
-            if not visited[neighbor.ID]:
-                queue.insert(0, neighbor.ID)
-                visited[neighbor.ID] = True
-                pathList[neighbor.ID] = [edge.ID] if pathList.get(vID) is None else pathList[vID] + [edge.ID]
-                rec(neighbor.ID)
-    while queue:
-        rec(queue.pop(0))
-    return pathList
+    :param workers: optional, number of processes the sources are split across, see SearchSources. Default is the current process only
+    :return: paths dictionary - {sourceID : Paths {targetID [path to the target-edges list)]}}, paths are built when read
+    """
+    g = g if isinstance(g, FrozenGraph) else g.Freeze()
+    sources = [g.VertexIndex[v.ID] for v in fromSet]
+    results = SearchSources(__DFSParents, g.CSR(directed), sources, workers=workers)
+    return {g.VertexIDs[src]: Paths(g, src, parents, reverse=directed == 'Into') for src, parents in zip(sources, results)}
+
+
+def DFSOrder(g: Graph, sourceID, *, directed='None'):
+    """
+    Yields the vertices reached from the source in depth first (pre)order, without building any path.
+    :param g: Graph type, or a FrozenGraph snapshot of a graph. A graph is frozen for the search
+    :param directed: 'Into' / 'From' / None, as in DFS
+    :return: generator of (vertexID, parentID, edgeID) - the vertex, the vertex it was reached from and the edge between them, the source excluded
+    """
+    g = g if isinstance(g, FrozenGraph) else g.Freeze()
+    indptr, indices, edges = (a.tolist() for a in g.CSR(directed))
+    vertexIDs, edgeIDs = g.VertexIDs, g.EdgeIDs
+    for u, w, k in __DFS(indptr, indices, g.VertexIndex[sourceID]):
+        yield vertexIDs[w], vertexIDs[u], edgeIDs[edges[k]]
+
+
+def __DFSParents(csr, src):
+    """
+    :return: parents - {vertex index: (parent vertex index, edge index)} of every vertex reached from src
+    """
+    indptr, indices, edges = csr
+    return {w: (u, edges[k]) for u, w, k in __DFS(indptr, indices, src)}
+
+
+def __DFS(indptr, indices, src):
+    """
+    Searches with a stack of (vertex, next CSR position) instead of recursion, so deep graphs do not exceed the recursion limit.
+    :return: generator of (parent index, vertex index, CSR position of the edge) of every vertex reached, in depth first order
+    """
+    visited = [False] * (len(indptr) - 1)
+    visited[src] = True
+    stack = [(src, indptr[src])]
+    while stack:
+        v, k = stack[-1]
+        end = indptr[v + 1]
+        while k < end and visited[indices[k]]: k += 1
+        if k == end:
+            stack.pop()
+            continue
+        stack[-1] = (v, k + 1)
+        visited[neighbor := indices[k]] = True
+        stack.append((neighbor, indptr[neighbor]))
+        yield v, neighbor, k
@@ -1,43 +1,168 @@
 import sys
-from queue import PriorityQueue
+import numpy as np
+from collections.abc import Mapping
+from functools import partial
+from heapq import heappush, heappop
+from inograph.classes.graphs.FrozenGraph import FrozenGraph
 from inograph.classes.graphs.Graph import Graph
+from inograph.algorithms.spanning.Paths import Paths
+from inograph.algorithms.spanning.Parallel import SearchSources
+from inograph.algorithms.spanning.CSGraph import CSGraphDijkstra
+from inograph.modules.mathematics.Geometry import GlobeDistance
 
+OPPOSITE = {'None': 'None', 'From': 'Into', 'Into': 'From'}
 
-def Dijkstra(g: Graph, fromSet, *, directed='None', weightFunction=lambda e: 1):
+
+def Dijkstra(g: Graph, fromSet, *, directed='None', weightFunction=lambda e: 1, weights=None, targets=None,
+             bidirectional: bool = False, heuristic=None, workers: int = None,
+             backend: str = 'python'):
     """
-    :param g: Graph type
+    :param g: Graph type, or a FrozenGraph snapshot of a graph. A graph is frozen for the search
     :param fromSet: set of the sources id's
     :param directed: 'Into' (all path into source vertex) / 'From' (all paths from source vertex) / None (indirect)
-    :param weightFunction: function from edge to edge weight
-    :return: paths dictionary - {sourceID : {targetID [path to the target-edges list)]}
-    """
-    EdgesSubsetType = {'Into': 'IncomingEdgeList', 'From': 'OutgoingEdgeList', 'None': 'AdjacentEdgeList'}[directed]
-    def reversePath(path):
-        path.reverse()
-        return path
-    return {v.ID: {k: (reversePath(path) if directed == 'Into' else path) for k, path in
-                   __dijkstra(g, v.ID, EdgesSubsetType, weightFunction).items()} for v in fromSet}
-
-
-def __dijkstra(g: Graph, srcID, EdgesSubsetType, weightFunction):
-    D = {vID: sys.maxsize for vID in g.Vertices}
-    visited = {vID: False for vID in g.Vertices}
-    D[srcID] = 0
-    pathList = {}
-    pq = PriorityQueue()
-    pq.put((D[srcID], srcID))
-    while not pq.empty():
-        (dist, vID) = pq.get()
-        visited[vID] = True
-        for edge in getattr(g, EdgesSubsetType)(vID):
-            neighbor = edge.Source if edge.Source.ID != vID else edge.Target
-            if not visited[neighbor.ID]:
-                distance = D[vID] + weightFunction(edge.ID)
-                if distance < D[neighbor.ID]:
-                    pq.put((distance, neighbor.ID))
-                    D[neighbor.ID] = distance
-                    if pathList.get(vID) is None:
-                        pathList[neighbor.ID] = [edge.ID]
-                    else:
-                        pathList[neighbor.ID] = pathList[vID] + [edge.ID]
-    return pathList
+    :param weightFunction: function from edge to edge weight, evaluated once per edge for all the sources
+    :param weights: optional, used instead of weightFunction. The name of a column of the graph's EdgeAttributes or of an
+                    attribute of the edges, a mapping {edgeID: weight}, or a list or array of the weight of every edge in the
+                    order of the graph's Edges
+    :param targets: optional, set of the targets' IDs. Only their paths are returned, and each search stops once they are all found
+    :param bidirectional: True to search from the source and from the target at once, for every target. Requires targets
+    :param heuristic: optional, A* search towards the targets. A function (vertexID, targetID) returning a consistent lower
+                      bound of the distance between them, or 'GlobeDistance' for the distance in kilometers between the Location of
+                      the vertices (the Sites of a network), a lower bound when no edge weighs less than the GlobeDistance
+                      between its vertices
+    :param workers: optional, number of processes the sources are split across, see SearchSources. A heuristic function
+                    must be picklable when processes are not forked
+    :param backend: 'python' / 'csgraph' to search with scipy.sparse.csgraph, whose adjacency is kept until the graph is
+                    mutated. Paths of equal length may differ from the 'python' ones. Bidirectional, A* and workers searches are 'python' only
+    :return: paths dictionary - {sourceID : Paths {targetID [path to the target-edges list)]}}, paths are built when read
+    """
+    if backend == 'csgraph':
+        if bidirectional or heuristic is not None or workers: raise Exception("The csgraph backend does not support bidirectional, A* or workers searches.")
+        return CSGraphDijkstra(g, [v.ID for v in fromSet], lambda frozen: __weightArray(frozen, weightFunction, weights),
+                               directed, targets)
+    if backend != 'python': raise Exception(f"Unknown backend {backend}, use 'python' or 'csgraph'.")
+    g = g if isinstance(g, FrozenGraph) else g.Freeze()
+    if targets is not None: targets = [g.VertexIndex[ID] for ID in targets]
+    elif bidirectional or heuristic is not None: raise Exception("Bidirectional and A* searches require targets.")
+    if bidirectional and heuristic is not None: raise Exception("A bidirectional search does not use a heuristic.")
+    arrays = [*g.CSR(directed), *(g.CSR(OPPOSITE[directed]) if bidirectional else ()), __weightArray(g, weightFunction, weights)]
+    bound = None if heuristic is None else __bound(g, heuristic, targets)
+    sources = [g.VertexIndex[v.ID] for v in fromSet]
+    results = SearchSources(__search, arrays, sources, targets, bidirectional, bound, workers=workers)
+    return {g.VertexIDs[src]: Paths(g, src, parents, reverse=directed == 'Into', targets=targets)
+            for src, parents in zip(sources, results)}
+
+
+def __weightArray(frozen: FrozenGraph, weightFunction, weights):
+    """
+    :return: array of the weight of every edge of the snapshot, aligned with its EdgeIDs, see Dijkstra
+    """
+    if weights is None: return np.array([weightFunction(eID) for eID in frozen.EdgeIDs])
+    if isinstance(weights, str):
+        if weights in frozen.EdgeColumns: return frozen.EdgeColumn(weights)
+        values = [getattr(edge, weights, None) for edge in frozen.Edges.values()]
+        if (i := next((i for i, w in enumerate(values) if w is None), None)) is not None:
+            raise Exception(f"Edge {frozen.EdgeIDs[i]} has no weight {weights}, which is neither an edge column nor an edge attribute.")
+        return np.array(values)
+    if isinstance(weights, Mapping): return np.array([weights[eID] for eID in frozen.EdgeIDs])
+    if len(weights) != len(frozen.EdgeIDs): raise Exception(f"{len(weights)} weights were given for {len(frozen.EdgeIDs)} edges.")
+    return np.asarray(weights)
+
+
+def __search(arrays, src, targets, bidirectional, bound):
+    """
+    :param arrays: the CSR lists, followed by the CSR lists of the opposite direction for a bidirectional search, followed
+                   by the weight of every edge
+    :return: parents - {vertex index: (parent vertex index, edge index)} of the vertices reached from src
+    """
+    weights = arrays[-1]
+    if not bidirectional: return __dijkstra(arrays[:3], weights, src, targets, bound)
+    parents = {}
+    for t in targets:
+        [parents.setdefault(w, parent) for w, parent in __bidirectional(arrays[:3], arrays[3:6], weights, src, t).items()]
+    return parents
+
+
+def __dijkstra(csr, weights, src, targets=None, bound=None):
+    """
+    Dijkstra's search, or A* with a bound. Outdated heap entries are skipped when popped.
+    :param weights: list of the weight of every edge index
+    :param targets: optional, vertex indices, the search stops once they are all settled
+    :param bound: optional, function from vertex index to a lower bound of its distance to the targets
+    :return: parents - {vertex index: (parent vertex index, edge index)} of every vertex reached
+    """
+    indptr, indices, edges = csr
+    D = [sys.maxsize] * (len(indptr) - 1)
+    visited = [False] * (len(indptr) - 1)
+    remaining = None if targets is None else set(targets) - {src}
+    D[src] = 0
+    parents = {}
+    heap = [(0, src)]
+    if remaining is not None and not remaining: return parents
+    while heap:
+        v = heappop(heap)[1]
+        if visited[v]: continue
+        visited[v] = True
+        if remaining is not None:
+            remaining.discard(v)
+            if not remaining: break
+        for k in range(indptr[v], indptr[v + 1]):
+            if not visited[neighbor := indices[k]]:
+                distance = D[v] + weights[e := edges[k]]
+                if distance < D[neighbor]:
+                    D[neighbor] = distance
+                    parents[neighbor] = (v, e)
+                    heappush(heap, (distance if bound is None else distance + bound(neighbor), neighbor))
+    return parents
+
+
+def __bidirectional(csr, backward, weights, src, target):
+    """
+    Searches from the source forwards and from the target backwards until the shortest path between them is known.
+    :param backward: the CSR of the opposite direction of csr
+    :return: parents - {vertex index: (parent vertex index, edge index)} of the vertices on the path, empty if there is none
+    """
+    if src == target: return {}
+    sides = [(csr, {src: 0}, {}, set(), [(0, src)]), (backward, {target: 0}, {}, set(), [(0, target)])]
+    best, meeting = sys.maxsize, None
+    while sides[0][4] and sides[1][4] and sides[0][4][0][0] + sides[1][4][0][0] < best:
+        side = 0 if sides[0][4][0][0] <= sides[1][4][0][0] else 1
+        (indptr, indices, edges), D, parents, settled, heap = sides[side]
+        other = sides[1 - side][1]
+        v = heappop(heap)[1]
+        if v in settled: continue
+        settled.add(v)
+        for k in range(indptr[v], indptr[v + 1]):
+            distance = D[v] + weights[e := edges[k]]
+            if distance < D.get(neighbor := indices[k], sys.maxsize):
+                D[neighbor] = distance
+                parents[neighbor] = (v, e)
+                heappush(heap, (distance, neighbor))
+            if neighbor in other and D[neighbor] + other[neighbor] < best:
+                best, meeting = D[neighbor] + other[neighbor], neighbor
+    if meeting is None: return {}
+    forward, backward = sides[0][2], sides[1][2]
+    path, v = {}, meeting
+    while v != src:
+        path[v] = forward[v]
+        v = forward[v][0]
+    v = meeting
+    while v != target:
+        w, e = backward[v]
+        path[w] = (v, e)
+        v = w
+    return path
+
+
+def __bound(g: FrozenGraph, heuristic, targets):
+    """
+    :return: function from vertex index to the smallest heuristic distance from the vertex to the targets, computed once per vertex
+    """
+    if heuristic == 'GlobeDistance': heuristic, keys = GlobeDistance, [v.Location for v in g.Vertices.values()]
+    else: keys = g.VertexIDs
+    return partial(__smallestBound, heuristic, keys, [keys[t] for t in targets], {})
+
+
+def __smallestBound(heuristic, keys, targets, bounds, v):
+    if (b := bounds.get(v)) is None: b = bounds[v] = min(heuristic(keys[v], t) for t in targets)
+    return b
@@ -0,0 +1,51 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+__worker = None  # (search, arrays as lists, args) of a worker process, see __attach
+
+
+def SearchSources(search, arrays, sources, *args, workers: int = None):
+    """
+    Runs search(lists, source, *args) for every source, lists being the arrays converted to lists.
+    With workers, the sources are split across a process pool. The arrays - the CSR of a FrozenGraph and the edge weights -
+    are written once to shared memory and read once by every process, instead of the graph being copied to every task.
+    search and args are sent once to every process and must be picklable when processes are not forked.
+    :param search: function of the module level, (lists, source, *args) to the result of the source
+    :param arrays: list of numpy arrays
+    :param workers: optional, number of processes the sources are split across. Default is the current process only
+    :return: generator of the results in the order of sources, yielded as they are computed
+    """
+    sources = list(sources)
+    if not workers or workers < 2 or len(sources) < 2:
+        lists = [a.tolist() for a in arrays]
+        yield from (search(lists, source, *args) for source in sources)
+        return
+    blocks = [SharedMemory(create=True, size=max(a.nbytes, 1)) for a in arrays]
+    try:
+        specs = []
+        for array, block in zip(arrays, blocks):
+            np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+            specs.append((block.name, array.shape, array.dtype.str))
+        with ProcessPoolExecutor(workers, initializer=__attach, initargs=(search, specs, args)) as pool:
+            yield from pool.map(__search, sources, chunksize=max(1, len(sources) // (workers * 4)))
+    finally:
+        [(block.close(), block.unlink()) for block in blocks]
+
+
+def __attach(search, specs, args):
+    """
+    Reads the arrays from shared memory once when a worker process starts.
+    """
+    global __worker
+    lists = []
+    for blockName, shape, dtype in specs:
+        block = SharedMemory(name=blockName)
+        try: lists.append(np.ndarray(shape, dtype, buffer=block.buf).tolist())
+        finally: block.close()
+    __worker = (search, lists, args)
+
+
+def __search(source):
+    search, lists, args = __worker
+    return search(lists, source, *args)
@@ -0,0 +1,62 @@
+from collections.abc import Mapping
+from inograph.classes.graphs.FrozenGraph import FrozenGraph
+
+
+class Paths(Mapping):
+    """
+    The paths found by a search from one source - {targetID: [path to the target - edges list]}, the source excluded.
+    Only the parent of every reached vertex is kept, and a path is built from the parents when it is read, so a search
+    costs O(V + E) however long its paths are. Targets are ordered as they were reached.
+    Compares equal to the dictionary of its paths, use dict(paths) for a plain dictionary.
+    """
+    __slots__ = ('__g', '__source', '__parents', '__reverse', '__targets')
+
+    def __init__(self, g: FrozenGraph, source, parents, *, reverse=False, targets=None):
+        """
+        :param g: the FrozenGraph searched
+        :param source: the index of the source vertex
+        :param parents: {vertex index: (parent vertex index, edge index)} of every reached vertex but the source
+        :param reverse: True for paths from the target to the source, as in searches 'Into' the source
+        :param targets: optional, the indices of the only reached vertices whose paths are given, for searches which stop
+                        before the parents of other vertices are final
+        """
+        self.__g, self.__source, self.__parents, self.__reverse = g, source, parents, reverse
+        self.__targets = None if targets is None else dict.fromkeys(v for v in targets if v in parents)
+
+    def __getitem__(self, targetID):
+        if (v := self.__g.VertexIndex.get(targetID)) is None or v not in self.__reached: raise KeyError(targetID)
+        edgeIDs, parents, path = self.__g.EdgeIDs, self.__parents, []
+        while v != self.__source:
+            v, e = parents[v]
+            path.append(edgeIDs[e])
+        if not self.__reverse: path.reverse()
+        return path
+
+    def __contains__(self, targetID):
+        return self.__g.VertexIndex.get(targetID) in self.__reached
+
+    def __iter__(self):
+        vertexIDs = self.__g.VertexIDs
+        return (vertexIDs[v] for v in self.__reached)
+
+    def __len__(self):
+        return len(self.__reached)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    @property
+    def __reached(self):
+        return self.__parents if self.__targets is None else self.__targets
+
+    @property
+    def Source(self):
+        return self.__g.VertexIDs[self.__source]
+
+    def Parent(self, targetID):
+        """
+        :return: (parentID, edgeID) - the vertex before the target on its path and the edge between them, None if the target was not reached
+        """
+        if (v := self.__g.VertexIndex.get(targetID)) not in self.__reached: return None
+        parent = self.__parents[v]
+        return self.__g.VertexIDs[parent[0]], self.__g.EdgeIDs[parent[1]]
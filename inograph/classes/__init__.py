@@ -1,4 +1,4 @@
-from graphs import *
-from edges import *
-from vertices import *
-from abstracts import *
+from .graphs import *
+from .edges import *
+from .vertices import *
+from .abstracts import *
@@ -1,14 +1,64 @@
+import weakref
 from abc import ABC
 
 
 class Extendable(ABC):
+    __slots__ = ()
+
     def __getattr__(self, prop):
         return None
 
+    @property
+    def _attributes(self):
+        """
+        The dictionary holding the dynamic attributes of the object
+        """
+        return self.__dict__
+
+    def _dynamicAttributes(self):
+        """
+        :return: a dictionary of the values of the dynamic attributes of the object
+        """
+        return dict(self._attributes)
+
+    def _dynamicProperties(self):
+        return self._dynamicAttributes()
+
     def UpdateFromDictionary(self, data):
-        self.__dict__.update(data)
+        self._attributes.update(data)
         return self
 
     def UpdateFromObject(self, obj: 'Extendable'):
-        self.UpdateFromDictionary(obj.__dict__)
+        self.UpdateFromDictionary(obj._dynamicAttributes() if isinstance(obj, Extendable) else obj.__dict__)
         return self
+
+
+class CompactExtendable(Extendable):
+    """
+    Extendable for classes declaring __slots__, whose objects have no __dict__.
+    Dynamic attributes are kept in a side table weakly keyed by the object, allocated only for objects which are extended.
+    Subclasses must declare a __weakref__ slot.
+    """
+    __slots__ = ()
+    __sideTable = weakref.WeakKeyDictionary()
+
+    def __getattr__(self, prop):
+        attributes = CompactExtendable.__sideTable.get(self)
+        return attributes.get(prop) if attributes else None
+
+    def __setattr__(self, name, value):
+        if hasattr(type(self), name): object.__setattr__(self, name, value)
+        else: self._attributes[name] = value
+
+    def __dir__(self):
+        return [*super().__dir__(), *CompactExtendable.__sideTable.get(self, ())]
+
+    @property
+    def _attributes(self):
+        return CompactExtendable.__sideTable.setdefault(self, {})
+
+    def _dynamicAttributes(self):
+        return dict(CompactExtendable.__sideTable.get(self, ()))
+
+    def FromDictionary(self, data):
+        return self.UpdateFromDictionary(data)
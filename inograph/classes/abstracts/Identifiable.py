@@ -1,14 +1,35 @@
+import itertools
 import uuid
 from abc import ABC
 
 
 class Identifiable(ABC):
+    __slots__ = ('__ID',)
+    __factory = None  # generates the IDs, uuid4 hex strings when None
+
     def __init__(self, ID=None):
-        self.__ID = ID if ID is not None and ID is not False else uuid.uuid4().hex
+        self.__ID = ID if ID is not None and ID is not False else None  # generated on first read
 
     @property
     def ID(self):
+        if self.__ID is None: self.generateNewID()
         return self.__ID
 
     def generateNewID(self):
-        self.__ID = uuid.uuid4().hex
+        self.__ID = Identifiable.__factory() if Identifiable.__factory else uuid.uuid4().hex
+
+    @staticmethod
+    def SetIDFactory(factory=None):
+        """
+        Sets how IDs are generated for every Identifiable object created without an ID.
+        :param factory: optional, a function with no arguments returning a new ID. Default is uuid4 hex strings
+        """
+        Identifiable.__factory = factory
+
+    @staticmethod
+    def SequentialIDs(start: int = 0):
+        """
+        Integer IDs are shorter to store and faster to hash than uuid strings, but are unique within the process only.
+        :return: an ID factory returning the integers start, start + 1, ...
+        """
+        return itertools.count(start).__next__
@@ -1,19 +1,81 @@
+import weakref
 from abc import ABC
+from operator import attrgetter
 
 
 class Mappable(ABC):
+    """
+    Objects which can be written to and read from dictionaries.
+    The public non-callable attributes declared by a class are found once per class, and ToDictionary reads them with a
+    single getter compiled for the class. Only the dynamic attributes of each object are looked up per object.
+    """
+    __slots__ = ()
+    __serializers = weakref.WeakKeyDictionary()  # {class: (names, getter)}
+    __writables = weakref.WeakKeyDictionary()  # {class: names of the properties with a setter}
+
     def ToDictionary(self, *, includeOnly=None, **kwargs):
-        def value(x):
-            if issubclass(type(x), Mappable): x = x.ToDictionary(includeOnly=kwargs.get(type(x).__name__, None))
-            elif type(x) == dict: x = {key: value(val) for key, val in x.items()}
-            elif type(x) in [tuple, list, set]: x = type(x)(value(val) for val in x)
-            return x
-        includeOnly = includeOnly if includeOnly else self.Properties()
-        return {name: value(getattr(self, name)) for name in includeOnly}
+        if includeOnly: return {name: Mappable._serialize(getattr(self, name), kwargs) for name in includeOnly}
+        return {name: Mappable._serialize(x, kwargs) for name, x in self._properties()}
 
     def Properties(self):
-        return [name for name in dir(self) if not name.startswith('_') and not callable(getattr(self, name))]
+        return [name for name, _ in self._properties()]
 
     def FromDictionary(self, data):
         self.__dict__.update(data)
         return self
+
+    def Record(self):
+        """
+        :return: a flat dictionary of the attributes of the object which can be written back - the properties with a
+                 setter and the dynamic attributes, see .FromRecord
+        """
+        if (names := Mappable.__writables.get(type(self))) is None:
+            names = Mappable.__writables[type(self)] = [name for name in dir(type(self)) if not name.startswith('_') and
+                                                        getattr(getattr(type(self), name, None), 'fset', None) is not None]
+        names = [*names, *(name for name in self._dynamicProperties() if not name.startswith('_') and name not in names)]
+        return {name: Mappable._serialize(x, {}) for name in names if not callable(x := getattr(self, name))}
+
+    def FromRecord(self, record):
+        """
+        Sets every attribute of a dictionary returned by .Record, through the setters of the properties.
+        """
+        [setattr(self, name, value) for name, value in record.items()]
+        return self
+
+    def _dynamicProperties(self):
+        """
+        :return: the names of the attributes of the object which are not declared by its class
+        """
+        return getattr(self, '__dict__', None) or ()
+
+    def _properties(self):
+        """
+        :return: [(name, value)] of the public non-callable attributes of the object, ordered by name as in dir()
+        """
+        names, getter = Mappable.__serializer(type(self))
+        properties = list(zip(names, getter(self)))
+        if extra := [name for name in self._dynamicProperties() if not name.startswith('_') and name not in names]:
+            properties = sorted(properties + [(name, getattr(self, name)) for name in extra])
+        return [(name, x) for name, x in properties if not callable(x)]
+
+    @staticmethod
+    def _serialize(x, kwargs):
+        """
+        :return: x with every Mappable replaced by its dictionary, in nested dictionaries, lists, tuples and sets as well.
+                 Mappables of class C include only the names in kwargs['C'] if given
+        """
+        if isinstance(x, Mappable): return x.ToDictionary(includeOnly=kwargs.get(type(x).__name__, None))
+        if (t := type(x)) is dict: return {key: Mappable._serialize(val, kwargs) for key, val in x.items()}
+        if t is list or t is tuple or t is set: return t(Mappable._serialize(val, kwargs) for val in x)
+        return x
+
+    @staticmethod
+    def __serializer(cls):
+        """
+        :return: (names, getter) - the set of public non-callable attributes declared by cls, and a function returning their values for an object
+        """
+        if (serializer := Mappable.__serializers.get(cls)) is not None: return serializer
+        names = [name for name in dir(cls) if not name.startswith('_') and not callable(getattr(cls, name, None))]
+        getter = attrgetter(*names) if len(names) > 1 else (lambda obj: (getattr(obj, names[0]),)) if names else (lambda obj: ())
+        serializer = Mappable.__serializers[cls] = dict.fromkeys(names), getter
+        return serializer
@@ -0,0 +1,40 @@
+import weakref
+from abc import ABC
+
+
+class Observable(ABC):
+    """
+    Lets other objects subscribe to changes of the object's properties.
+    Subscriptions are kept outside of the object, so they are not carried over by .Copy or .UpdateFromObject.
+    Bound methods are held weakly - subscribing does not keep the subscriber alive.
+    """
+    __subscribers = weakref.WeakKeyDictionary()
+
+    def Subscribe(self, callback):
+        """
+        :param callback: function(obj, propertyName, item) called after a property of the object changes.
+                         item is the element added or removed when the property is a collection, None otherwise
+        :return: the callback
+        """
+        ref = Observable.__weakMethod(callback) if hasattr(callback, '__self__') else lambda: callback
+        if (refs := Observable.__subscribers.get(self)) is None: refs = Observable.__subscribers[self] = []
+        refs.append(ref)
+        return callback
+
+    def Unsubscribe(self, callback):
+        refs = Observable.__subscribers.get(self, [])
+        refs[:] = [ref for ref in refs if ref() is not None and ref() != callback]
+
+    def _notify(self, propertyName, item=None):
+        for ref in list(Observable.__subscribers.get(self, ())):
+            if (callback := ref()) is not None: callback(self, propertyName, item)
+
+    @staticmethod
+    def __weakMethod(method):
+        """
+        weakref.WeakMethod fails in its finalizer when it is collected in the same cycle as the method's object,
+        so only the object is referenced weakly and the method is bound again on call.
+        :return: a function returning the bound method, or None once its object is collected
+        """
+        owner, function = weakref.ref(method.__self__), method.__func__
+        return lambda: None if (obj := owner()) is None else function.__get__(obj)
@@ -1,3 +1,4 @@
-from Extendable import Extendable
-from Identifiable import Identifiable
-from Mappable import Mappable
+from .Extendable import Extendable, CompactExtendable
+from .Identifiable import Identifiable
+from .Mappable import Mappable
+from .Observable import Observable
\ No newline at end of file
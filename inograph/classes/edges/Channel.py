@@ -1,6 +1,6 @@
 from inograph.classes.abstracts.Mappable import Mappable
+from inograph.classes.abstracts.Observable import Observable
 from inograph.classes.edges.Edge import Edge
-from inograph.modules.mathematics.Geometry import GlobeDistance
 from inograph.modules.mathematics.RF import FSPL, AttenuatedLevel, ChannelNoise
 
 defaults = {  # defaults are for 1ft antenna, frequency 15Ghz and a common bandwidth profile
@@ -12,7 +12,7 @@ defaults = {  # defaults are for 1ft antenna, frequency 15Ghz and a common bandw
 }
 
 
-class Channel(Edge, Mappable):
+class Channel(Edge, Mappable, Observable):
     def __init__(self, link, *, frequency=defaults['frequency'],
                                       bandwidth=defaults['bandwidth'],
                                       TxLevel=defaults['TxLevel'],
@@ -38,6 +38,16 @@ class Channel(Edge, Mappable):
     @Frequency.setter
     def Frequency(self, frequency):
         self.__frequency = frequency
+        self._notify('Frequency')
+
+    @property
+    def Bandwidth(self):
+        return self.__bandwidth
+
+    @Bandwidth.setter
+    def Bandwidth(self, bandwidth):
+        self.__bandwidth = bandwidth
+        self._notify('Bandwidth')
 
     @property
     def TxLevel(self):
@@ -46,6 +56,7 @@ class Channel(Edge, Mappable):
     @TxLevel.setter
     def TxLevel(self, level):
         self.__TxLevel = level
+        self._notify('TxLevel')
 
     @property
     def TxGain(self):
@@ -54,6 +65,7 @@ class Channel(Edge, Mappable):
     @TxGain.setter
     def TxGain(self, gain):
         self.__TxGain = gain
+        self._notify('TxGain')
 
     @property
     def RxGain(self):
@@ -62,10 +74,11 @@ class Channel(Edge, Mappable):
     @RxGain.setter
     def RxGain(self, gain):
         self.__RxGain = gain
+        self._notify('RxGain')
 
     @property
     def Distance(self):
-        return GlobeDistance(self.Source.Location, self.Target.Location)
+        return self.__link.Distance
 
     @property
     def FSPL(self):
@@ -79,7 +92,10 @@ class Channel(Edge, Mappable):
     def ChannelNoise(self):
         return ChannelNoise(self.__bandwidth)
 
+    @property
+    def Bearing(self):
+        return self.__link.Bearing
+
     @property
     def Vector(self):
-        sLoc, tLoc = self.Source.Location, self.Target.Location
-        return tLoc[0] - sLoc[0], tLoc[1] - sLoc[1]
+        return self.__link.Vector
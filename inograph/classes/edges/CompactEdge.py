@@ -0,0 +1,30 @@
+from inograph.classes.abstracts.Identifiable import Identifiable
+from inograph.classes.abstracts.Extendable import CompactExtendable
+from inograph.classes.abstracts.Mappable import Mappable
+
+
+class CompactEdge(Identifiable, CompactExtendable, Mappable):
+    """
+    An Edge without a __dict__, for graphs with millions of edges. See CompactVertex.
+    """
+    __slots__ = ('__source', '__target', '__weakref__')
+
+    def __init__(self, v1, v2, *, ID=None):
+        super().__init__(ID)
+        self.__source, self.__target = v1, v2
+
+    @property
+    def Vertices(self) -> tuple:
+        return self.__source, self.__target
+
+    @property
+    def Source(self):
+        return self.__source
+
+    @property
+    def Target(self):
+        return self.__target
+
+    def Copy(self, *, deep: bool = False):
+        vs = tuple(v.Copy() for v in self.Vertices) if deep else self.Vertices
+        return type(self)(*vs, ID=self.ID).UpdateFromObject(self)
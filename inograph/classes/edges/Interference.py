@@ -5,12 +5,25 @@ from inograph.modules.mathematics.RF import RPF, FSPL, AttenuatedLevel
 
 
 class Interference(Edge):
-    def __init__(self, originChannel: Channel, interferedChannel: Channel, *, ID=None):
+    """
+    The interference of originChannel on interferedChannel.
+    Angles, gains, distance and RxLevel are computed on first read and memoized, so they reflect the channels at that time.
+    """
+    __slots__ = ('__originChannel', '__interferedChannel', '__rejection', '__vector', '__transmissionAngle', '__arrivalAngle',
+                 '__TxGain', '__RxGain', '__distance', '__RxLevel')
+
+    def __init__(self, originChannel: Channel, interferedChannel: Channel, *, rejection: float = 0, RxLevel: float = None, ID=None):
+        """
+        :param rejection: optional, in DB, attenuation of the interference due to frequency separation. See RF.FrequencyRejection
+        :param RxLevel: optional, the RxLevel when already computed elsewhere, e.g. by InterferenceMatrix.TiledInterference
+        """
         super().__init__(originChannel.Source, interferedChannel.Target, ID=ID)
         self.__originChannel = originChannel
         self.__interferedChannel = interferedChannel
-        self.__transmissionAngle = AngleBetweenVectors(self.__originChannel.Vector, self.Vector)
-        self.__arrivalAngle = AngleBetweenVectors(ReverseVector(self.__interferedChannel.Vector), ReverseVector(self.Vector))
+        self.__rejection = rejection
+        self.__vector = self.__transmissionAngle = self.__arrivalAngle = None
+        self.__TxGain = self.__RxGain = self.__distance = None
+        self.__RxLevel = RxLevel
 
     @property
     def originChannel(self):
@@ -22,12 +35,20 @@ class Interference(Edge):
 
     @property
     def TransmissionAngle(self):
+        if self.__transmissionAngle is None:
+            self.__transmissionAngle = AngleBetweenVectors(self.__originChannel.Vector, self.Vector)
         return self.__transmissionAngle
 
     @property
     def ArrivalAngle(self):
+        if self.__arrivalAngle is None:
+            self.__arrivalAngle = AngleBetweenVectors(ReverseVector(self.__interferedChannel.Vector), ReverseVector(self.Vector))
         return self.__arrivalAngle
 
+    @property
+    def Rejection(self):
+        return self.__rejection
+
     @property
     def Frequency(self):
         return self.__originChannel.Frequency
@@ -38,15 +59,18 @@ class Interference(Edge):
 
     @property
     def TxGain(self):
-        return RPF(self.__originChannel.TxGain, self.__transmissionAngle)
+        if self.__TxGain is None: self.__TxGain = RPF(self.__originChannel.TxGain, self.TransmissionAngle)
+        return self.__TxGain
 
     @property
     def RxGain(self):
-        return RPF(self.__interferedChannel.RxGain, self.__arrivalAngle)
+        if self.__RxGain is None: self.__RxGain = RPF(self.__interferedChannel.RxGain, self.ArrivalAngle)
+        return self.__RxGain
 
     @property
     def Distance(self):
-        return GlobeDistance(self.Source.Location, self.Target.Location)
+        if self.__distance is None: self.__distance = GlobeDistance(self.Source.Location, self.Target.Location)
+        return self.__distance
 
     @property
     def FSPL(self):
@@ -54,9 +78,13 @@ class Interference(Edge):
 
     @property
     def RxLevel(self):
-        return AttenuatedLevel(self.TxLevel, self.TxGain, self.RxGain, self.Frequency, self.Distance, 0, 0)
+        if self.__RxLevel is None:
+            self.__RxLevel = AttenuatedLevel(self.TxLevel, self.TxGain, self.RxGain, self.Frequency, self.Distance, 0, 0) - self.__rejection
+        return self.__RxLevel
 
     @property
     def Vector(self):
-        sLoc, tLoc = self.Source.Location, self.Target.Location
-        return tLoc[0] - sLoc[0], tLoc[1] - sLoc[1]
+        if self.__vector is None:
+            sLoc, tLoc = self.Source.Location, self.Target.Location
+            self.__vector = tLoc[0] - sLoc[0], tLoc[1] - sLoc[1]
+        return self.__vector
@@ -1,29 +1,57 @@
+from inograph.classes.abstracts.Observable import Observable
 from inograph.classes.edges.Channel import Channel
 from inograph.classes.edges.Edge import Edge
 from inograph.classes.vertices.Site import Site
+from inograph.modules.mathematics.Geometry import GlobeDistance, Bearing
 
 
-class Link(Edge):
+class Link(Edge, Observable):
     def __init__(self, site1: Site, site2: Site, *, ID=None):
         super().__init__(site1, site2, ID=ID)
         self.__channels = {}
+        self.__geometry = None  # (distance, bearing, vector), cleared when a site moves
+        [site.Subscribe(self.__onSiteChanged) for site in (site1, site2) if isinstance(site, Observable)]
 
     @property
     def Channels(self):
         return self.__channels
 
+    @property
+    def Distance(self):
+        return self.__getGeometry()[0]
+
+    @property
+    def Bearing(self):
+        return self.__getGeometry()[1]
+
+    @property
+    def Vector(self):
+        return self.__getGeometry()[2]
+
     def Channel(self, channelID):
         return self.__channels.get(channelID, None)
 
     def AddChannel(self, channel: Channel):
+        if (existing := self.__channels.get(channel.ID)) is not None and existing is not channel: self.RemoveChannel(channel.ID)
         self.__channels[channel.ID] = channel
+        self._notify('Channels', channel)
         return channel
 
     def RemoveChannel(self, channelID):
-        return self.__channels.pop(channelID, None)
+        if (channel := self.__channels.pop(channelID, None)) is not None: self._notify('Channels', channel)
+        return channel
 
     def FromDictionary(self, linkData):
         super().FromDictionary(linkData)
         [self.AddChannel(Channel(self, ID=channel.ID)).UpdateFromDictionary(channel)
          for channel in linkData.get('Channels', {}).values()]
         return self
+
+    def __getGeometry(self):
+        if self.__geometry is None:
+            sLoc, tLoc = self.Source.Location, self.Target.Location
+            self.__geometry = GlobeDistance(sLoc, tLoc), Bearing(sLoc, tLoc), (tLoc[0] - sLoc[0], tLoc[1] - sLoc[1])
+        return self.__geometry
+
+    def __onSiteChanged(self, site, propertyName, _):
+        if propertyName == 'Location': self.__geometry = None
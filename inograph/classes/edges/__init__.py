@@ -1,4 +1,5 @@
-from Edge import Edge
-from Channel import Channel
-from Interference import Interference
-from Link import Link
+from .Edge import Edge
+from .CompactEdge import CompactEdge
+from .Channel import Channel
+from .Interference import Interference
+from .Link import Link
@@ -0,0 +1,192 @@
+import numpy as np
+
+
+class AttributeStore:
+    """
+    Keeps named dynamic attributes of a set of elements (vertices or edges) in typed NumPy columns.
+    Row i of every column holds the attribute of the element with ID IDs[i], None rows are free.
+    Elements in the store keep reading and writing the attributes as before - their class is swapped for a subclass which
+    forwards the column attributes to the store, and restored with the values written back when they leave the store.
+    See Graph.EdgeAttributes and Graph.VertexAttributes.
+    """
+    def __init__(self, elements=()):
+        self.__columns, self.__defaults = {}, {}  # {name: array}, {name: default value}
+        self.__index = {}  # {ID: row}
+        self.__ids, self.__elements, self.__free = [], [], []  # .IDs, the element of every row, free rows
+        self.__classes = {}  # {class: bound subclass}
+        [self.Add(e) for e in elements]
+
+    def __len__(self):
+        return len(self.__index)
+
+    def __contains__(self, ID):
+        return ID in self.__index
+
+    @property
+    def IDs(self):
+        """
+        :return: the element ID of every row, None for free rows
+        """
+        return self.__ids
+
+    @property
+    def Names(self):
+        return list(self.__columns)
+
+    def Row(self, ID):
+        return self.__index.get(ID, None)
+
+    def Rows(self, IDs):
+        """
+        :return: array of the rows of the elements with the given IDs
+        """
+        return np.fromiter((self.__index[ID] for ID in IDs), dtype=np.int64, count=len(IDs))
+
+    def Column(self, name, IDs=None):
+        """
+        :param IDs: optional, the IDs of the elements to read. Default is every row, aligned with .IDs
+        :return: a read only view of the column, or the values of the elements with the given IDs
+        """
+        column = self.__columns[name][:len(self.__ids)] if IDs is None else self.__columns[name][self.Rows(IDs)]
+        column.flags.writeable = False
+        return column
+
+    def SetColumn(self, name, values, IDs=None):
+        """
+        Writes values, a scalar or an array aligned with .IDs (or with IDs if given), into the column.
+        """
+        self.__columns[name][:len(self.__ids) if IDs is None else self.Rows(IDs)] = values
+
+    def Select(self, mask):
+        """
+        :param mask: boolean array aligned with .IDs, e.g. store.Column('Weight') < x
+        :return: the IDs of the elements of the rows selected by mask
+        """
+        return [self.__ids[row] for row in np.flatnonzero(mask).tolist() if self.__ids[row] is not None]
+
+    def AddColumn(self, name, dtype=float, *, default=None):
+        """
+        Moves the attribute name of every element into a new column.
+        :param dtype: the NumPy type of the column
+        :param default: optional, the value of elements without the attribute. Default is nan for floats, 0 for numbers and None for objects
+        """
+        if name in self.__columns: raise Exception(f"The store already has a column {name}.")
+        if any(hasattr(cls, name) for cls in self.__classes): raise Exception(f"{name} is not a dynamic attribute of the elements.")
+        dtype = np.dtype(dtype)
+        if default is None: default = np.nan if dtype.kind in 'fc' else None if dtype.kind == 'O' else 0
+        column = np.full(len(self.__elements), default, dtype=dtype)
+        for row, ID in enumerate(self.__ids):
+            if ID is not None and name in (attributes := self.__attributes(self.__elements[row])):
+                column[row] = attributes.pop(name)
+        self.__columns[name] = column
+        self.__defaults[name] = default
+
+    def RemoveColumn(self, name):
+        """
+        Moves the column back into the attributes of the elements.
+        """
+        column = self.__columns.pop(name)
+        [self.__attributes(self.__elements[row]).update({name: self.__value(column, row)})
+         for row, ID in enumerate(self.__ids) if ID is not None]
+        del self.__defaults[name]
+
+    def Add(self, element):
+        """
+        Adds an element to the store, moving its attributes of the store's columns into the columns.
+        """
+        if element.ID in self.__index: raise Exception("The store already contains an element with this ID.")
+        cls = type(element)
+        if getattr(cls, '_AttributeStore__unbound', None) is not None: raise Exception("The element is in another attribute store.")
+        if self.__free: row = self.__free.pop()
+        else:
+            if len(self.__ids) == len(self.__elements): self.__grow()
+            row = len(self.__ids)
+            self.__ids.append(None)
+        self.__ids[row], self.__index[element.ID] = element.ID, row
+        self.__elements[row] = element
+        attributes = self.__attributes(element)
+        for name, column in self.__columns.items():
+            column[row] = attributes.pop(name) if name in attributes else self.__defaults[name]
+        element.__class__ = self.__boundClass(cls)
+        return element
+
+    def Remove(self, element):
+        """
+        Removes an element from the store, writing the values of its columns back into its attributes.
+        """
+        if (row := self.__index.pop(element.ID, None)) is None: return None
+        element.__class__ = type(element).__unbound
+        self.__attributes(element).update({name: self.__value(column, row) for name, column in self.__columns.items()})
+        self.__ids[row], self.__elements[row] = None, None
+        self.__free.append(row)
+        return element
+
+    def Values(self, element):
+        """
+        :return: {name: value} of the columns of an element in the store
+        """
+        row = self.__index[element.ID]
+        return {name: self.__value(column, row) for name, column in self.__columns.items()}
+
+    def __grow(self):
+        """
+        Doubles the capacity of the columns
+        """
+        size = max(2 * len(self.__elements), 16)
+        self.__elements += [None] * (size - len(self.__elements))
+        for name, column in self.__columns.items():
+            grown = np.full(size, self.__defaults[name], dtype=column.dtype)
+            grown[:len(column)] = column
+            self.__columns[name] = grown
+
+    @staticmethod
+    def __value(column, row):
+        value = column[row]
+        return value.item() if isinstance(value, np.generic) else value
+
+    @staticmethod
+    def __attributes(element):
+        """
+        :return: the dictionary of the dynamic attributes of an element, bound or not
+        """
+        return getattr(type(element), '_AttributeStore__unbound', type(element))._attributes.fget(element)
+
+    def __boundClass(self, cls):
+        """
+        :return: the subclass of cls forwarding the column attributes of its objects to the store
+        """
+        if (bound := self.__classes.get(cls)) is not None: return bound
+        store, columns = self, self.__columns
+
+        def __getattr__(element, name):
+            if name in columns and (row := store.__index.get(element.ID)) is not None: return store.__value(columns[name], row)
+            return cls.__getattr__(element, name)
+
+        def __setattr__(element, name, value):
+            if name in columns and (row := store.__index.get(element.ID)) is not None: columns[name][row] = value
+            else: cls.__setattr__(element, name, value)
+
+        def __dir__(element):
+            return [*cls.__dir__(element), *columns]
+
+        def _dynamicAttributes(element):
+            return {**cls._dynamicAttributes(element), **store.Values(element)}
+
+        def UpdateFromDictionary(element, data):
+            [__setattr__(element, name, data[name]) for name in data if name in columns]
+            return cls.UpdateFromDictionary(element, {name: value for name, value in data.items() if name not in columns})
+
+        def FromDictionary(element, data):
+            [__setattr__(element, name, data[name]) for name in data if name in columns]
+            return cls.FromDictionary(element, {name: value for name, value in data.items() if name not in columns})
+
+        def Copy(element, *args, **kwargs):
+            copy = cls.Copy(element, *args, **kwargs)
+            if type(copy) is bound: copy.__class__ = cls
+            return copy.UpdateFromDictionary(store.Values(element))
+
+        bound = self.__classes[cls] = type(cls.__name__, (cls,), {
+            '__slots__': (), '__module__': cls.__module__, '_AttributeStore__unbound': cls, '__getattr__': __getattr__,
+            '__setattr__': __setattr__, '__dir__': __dir__, '_dynamicAttributes': _dynamicAttributes,
+            'UpdateFromDictionary': UpdateFromDictionary, 'FromDictionary': FromDictionary, 'Copy': Copy})
+        return bound
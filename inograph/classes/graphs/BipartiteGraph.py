@@ -60,6 +60,12 @@ class BipartiteGraph(Graph):
             raise Exception("Cannot add an edge inside the same set of vertices in a bipartite graph.")
         return super().AddEdge(edge)
 
+    def _validateEdges(self, rows):
+        if any((sID in self.__leftSet and tID in self.__leftSet) or (sID in self.__rightSet and tID in self.__rightSet)
+               for *_, sID, tID in rows):
+            raise Exception("Cannot add an edge inside the same set of vertices in a bipartite graph.")
+        return super()._validateEdges(rows)
+
     def Connect(self, vertex1ID, vertex2ID, *, extendFrom=None, fromSet=None):
         """
         Adds an edge between two vertices according to their IDs.
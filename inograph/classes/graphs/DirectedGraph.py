@@ -1,5 +1,6 @@
 from inograph.modules.data.Dictionaries import ListDictionaryValues
 from inograph.classes.edges.Edge import Edge
+from inograph.classes.graphs.FrozenGraph import FrozenGraph
 from inograph.classes.graphs.Graph import Graph
 from inograph.classes.vertices.Vertex import Vertex
 
@@ -46,6 +47,11 @@ class DirectedGraph(Graph):
         self.__incomingAdjacency[edge.Target.ID][edge.Source.ID][edge.ID] = edge
         return edge
 
+    def _insertEdges(self, rows):
+        super()._insertEdges(rows)
+        self._fillAdjacency(self.__outgoingAdjacency, rows, 4, 5)
+        self._fillAdjacency(self.__incomingAdjacency, rows, 5, 4)
+
     def RemoveEdge(self, edgeID) -> Edge:
         if e := super().RemoveEdge(edgeID):
             del self.__outgoingAdjacency[e.Source.ID][e.Target.ID][edgeID]
@@ -54,6 +60,12 @@ class DirectedGraph(Graph):
             self._removeEmptyConnection(self.__incomingAdjacency, e.Target.ID, e.Source.ID)
         return e
 
+    def Freeze(self):
+        """
+        :return: an immutable CSR snapshot of the graph keeping the adjacency, outgoing ('From') and incoming ('Into') adjacency
+        """
+        return FrozenGraph(self, directions=('None', 'From', 'Into'))
+
     def GetFromTo(self, vertex1ID, vertex2ID):
         """
         Returns edges from a vertex to another.
@@ -51,6 +51,19 @@ class Forest(DirectedGraph):
         if not self.Vertex(edge.Target.ID): self._AddEndpoint(edge.Target)
         return super().AddEdge(edge)
 
+    def _validateEdges(self, rows):
+        targets = [row[5] for row in rows]
+        if len(set(targets)) < len(targets) or any(self.IncomingEdges(tID) for tID in targets):
+            raise Exception("Cannot add an edge towards a vertex that already has a parent in a forest.")
+        return super()._validateEdges(rows)
+
+    def _addEndpoints(self, vertices):
+        [self._AddEndpoint(v) for v in vertices]
+
+    def _insertEdges(self, rows):
+        [self.__roots.pop(row[5], None) for row in rows]
+        super()._insertEdges(rows)
+
     def RemoveEdge(self, edgeID):
         if not (e := super().RemoveEdge(edgeID)): return None
         self.__roots[e.Target.ID] = e.Target
@@ -0,0 +1,141 @@
+from types import MappingProxyType
+import numpy as np
+
+
+class FrozenGraph:
+    """
+    An immutable snapshot of a graph in compressed sparse row (CSR) form, see Graph.Freeze.
+    Vertices and edges are numbered 0..n-1 in the order of the graph. The edges adjacent to vertex i are listed in
+    Indices[Indptr[i]: Indptr[i + 1]] (the neighbor's index) and EdgeIndices[Indptr[i]: Indptr[i + 1]] (the edge's index),
+    in the order of the graph's adjacency. Directed graphs also keep the outgoing ('From') and incoming ('Into') adjacency.
+    The read methods of Graph are supported, so algorithms run on a snapshot as they do on the graph.
+    The columns of the graph's EdgeAttributes store are copied too, row i holding the value of edge EdgeIDs[i].
+    """
+    def __init__(self, graph, *, directions=('None',)):
+        """
+        :param graph: Graph to take the snapshot of
+        :param directions: 'None' (adjacency) / 'From' (outgoing adjacency) / 'Into' (incoming adjacency) to keep
+        """
+        self.__vertices, self.__edges = MappingProxyType(dict(graph.Vertices)), MappingProxyType(dict(graph.Edges))
+        self.__multigraph = graph.IsMultigraph
+        self.VertexIDs, self.EdgeIDs = list(self.__vertices), list(self.__edges)
+        self.VertexIndex = {vID: i for i, vID in enumerate(self.VertexIDs)}
+        self.EdgeIndex = {eID: i for i, eID in enumerate(self.EdgeIDs)}
+        self.__csr = {directed: self.__compress(graph, directed) for directed in directions}
+        self.__between = None
+        store = graph._edgeAttributes
+        self.__edgeColumns = {name: store.Column(name, self.EdgeIDs) for name in store.Names} if store is not None else {}
+
+    @property
+    def Indptr(self):
+        return self.__csr['None'][0]
+
+    @property
+    def Indices(self):
+        return self.__csr['None'][1]
+
+    @property
+    def EdgeIndices(self):
+        return self.__csr['None'][2]
+
+    @property
+    def Directions(self):
+        return tuple(self.__csr)
+
+    def CSR(self, directed='None'):
+        """
+        :param directed: 'None' (adjacency) / 'From' (outgoing adjacency) / 'Into' (incoming adjacency)
+        :return: (indptr, indices, edgeIndices) arrays of the adjacency
+        """
+        if directed not in self.__csr: raise Exception(f"The snapshot does not keep the '{directed}' adjacency.")
+        return self.__csr[directed]
+
+    @property
+    def Vertices(self):
+        return self.__vertices
+
+    @property
+    def Edges(self):
+        return self.__edges
+
+    @property
+    def IsMultigraph(self):
+        return self.__multigraph
+
+    @property
+    def EdgeColumns(self):
+        return list(self.__edgeColumns)
+
+    def EdgeColumn(self, name):
+        """
+        :return: read only array of the attribute name of every edge, aligned with EdgeIDs
+        """
+        if name not in self.__edgeColumns: raise Exception(f"The snapshot has no edge column {name}.")
+        return self.__edgeColumns[name]
+
+    def Vertex(self, ID):
+        return self.__vertices.get(ID, None)
+
+    def Edge(self, ID):
+        return self.__edges.get(ID, None)
+
+    def GetBetween(self, vertex1ID, vertex2ID):
+        """
+        Returns edges between two vertices given their IDs.
+        :return: an Edge if the graph is not a multigraph. Returns a list of edges otherwise
+        """
+        if self.__between is None:
+            indptr, indices, edges = (a.tolist() for a in self.CSR())
+            self.__between = {}
+            [self.__between.setdefault((i, indices[k]), []).append(self.__edges[self.EdgeIDs[edges[k]]])
+             for i in range(len(self.VertexIDs)) for k in range(indptr[i], indptr[i + 1])]
+        i, j = self.VertexIndex.get(vertex1ID), self.VertexIndex.get(vertex2ID)
+        if not (edges := self.__between.get((i, j))): return None
+        return list(edges) if self.__multigraph else edges[0]
+
+    def AreConnected(self, vertex1ID, vertex2ID):
+        return self.GetBetween(vertex1ID, vertex2ID) is not None
+
+    def AdjacentEdgeList(self, vertexID):
+        return self.__edgeList(vertexID, 'None')
+
+    def OutgoingEdgeList(self, vertexID):
+        return self.__edgeList(vertexID, 'From')
+
+    def IncomingEdgeList(self, vertexID):
+        return self.__edgeList(vertexID, 'Into')
+
+    def Neighbors(self, vertexID):
+        if (i := self.VertexIndex.get(vertexID)) is None: return None
+        indptr, indices, _ = self.CSR()
+        return list(dict.fromkeys(self.VertexIDs[j] for j in indices[indptr[i]: indptr[i + 1]].tolist())) or None
+
+    def Degree(self, vertexID):
+        neighbors = self.Neighbors(vertexID)
+        return len(neighbors) if neighbors else None
+
+    @property
+    def GraphDegree(self):
+        return max([self.Degree(vID) or 0 for vID in self.VertexIDs], default=0)
+
+    def __edgeList(self, vertexID, directed):
+        """
+        :return: the edges of the vertex in the adjacency directed, None if there are none, as Graph.AdjacentEdgeList
+        """
+        if (i := self.VertexIndex.get(vertexID)) is None: return None
+        indptr, _, edges = self.CSR(directed)
+        return [self.__edges[self.EdgeIDs[k]] for k in edges[indptr[i]: indptr[i + 1]].tolist()] or None
+
+    def __compress(self, graph, directed):
+        adjacency = getattr(graph, {'None': 'AdjacentEdges', 'From': 'OutgoingEdges', 'Into': 'IncomingEdges'}[directed])
+        indptr, indices, edges = [0], [], []
+        for vID in self.VertexIDs:
+            for uID, edgeMap in (adjacency(vID) or {}).items():
+                u = self.VertexIndex[uID]
+                for eID in edgeMap:
+                    indices.append(u)
+                    edges.append(self.EdgeIndex[eID])
+            indptr.append(len(indices))
+        arrays = tuple(np.array(a, dtype=np.int64) for a in (indptr, indices, edges))
+        [a.setflags(write=False) for a in arrays]
+        return arrays
@@ -1,4 +1,10 @@
+import gc
+import itertools
+from contextlib import contextmanager
+from types import GeneratorType
 from inograph.classes.abstracts.Mappable import Mappable
+from inograph.classes.graphs.AttributeStore import AttributeStore
+from inograph.classes.graphs.FrozenGraph import FrozenGraph
 from inograph.modules.data.Dictionaries import ListDictionaryValues
 from inograph.classes.edges.Edge import Edge
 from inograph.classes.vertices.Vertex import Vertex
@@ -12,6 +18,8 @@ class Graph(Mappable):
         self.__edges, self.__vertices = {}, {}
         self._multigraph = multigraph
         self.__adjacency = {}
+        self._vertexAttributes, self._edgeAttributes = None, None
+        self._revision = 0  # counts the changes of the vertices and edges, to tell whether data cached for the graph is outdated
 
     @property
     def Vertices(self):
@@ -29,6 +37,22 @@ class Graph(Mappable):
     def IsMultigraph(self):
         return self._multigraph
 
+    def VertexAttributes(self):
+        """
+        :return: the AttributeStore keeping the column attributes of the vertices, created on first use
+        """
+        if self._vertexAttributes is None: self._vertexAttributes = AttributeStore(self.__vertices.values())
+        return self._vertexAttributes
+
+    def EdgeAttributes(self):
+        """
+        The AttributeStore keeping the column attributes of the edges, created on first use. For example
+        g.EdgeAttributes().AddColumn('Weight') moves the Weight of every edge into a float array, after which
+        store.Select(store.Column('Weight') < x) finds the light edges, while e.Weight still reads and writes the edge's row.
+        """
+        if self._edgeAttributes is None: self._edgeAttributes = AttributeStore(self.__edges.values())
+        return self._edgeAttributes
+
     def Vertex(self, ID):
         return self.__vertices.get(ID, None)
 
@@ -43,8 +67,10 @@ class Graph(Mappable):
         vertex = vertex if vertex else Vertex()
         if self.Vertex(vertex.ID):
             raise Exception("The graph already contains a vertex with this ID.")
+        if self._vertexAttributes is not None: self._vertexAttributes.Add(vertex)
         self.__vertices[vertex.ID] = vertex
         self.__adjacency[vertex.ID] = {}
+        self._revision += 1
         return vertex
 
     def RemoveVertex(self, vertexID):
@@ -54,10 +80,11 @@ class Graph(Mappable):
         """
         if not (v := self.Vertex(vertexID)): return None, None
         es = [self.RemoveEdge(eID)
-              for edgeMap in self.AdjacentEdges(v.ID).values()
-              for eID in edgeMap]
+              for eID in [eID for edgeMap in self.AdjacentEdges(v.ID).values() for eID in edgeMap]]
         del self.__adjacency[v.ID]
         del self.__vertices[v.ID]
+        if self._vertexAttributes is not None: self._vertexAttributes.Remove(v)
+        self._revision += 1
         return v, es
 
     def AddEdge(self, edge: Edge):
@@ -76,13 +103,45 @@ class Graph(Mappable):
         v2 = v2 if v2 else self.AddVertex(edge.Target)
         if v1 != edge.Source or v2 != edge.Target:
             raise Exception("IDs of endpoints already in the graph but on different objects. You can use .Connect with extendFrom= but the edge would not be the same object.")
+        if self._edgeAttributes is not None: self._edgeAttributes.Add(edge)
         self.__edges[edge.ID] = edge
         if self.__adjacency[v1.ID].get(v2.ID, None) is None: self.__adjacency[v1.ID][v2.ID] = {}
         if self.__adjacency[v2.ID].get(v1.ID, None) is None: self.__adjacency[v2.ID][v1.ID] = {}
         self.__adjacency[v1.ID][v2.ID][edge.ID] = edge
         self.__adjacency[v2.ID][v1.ID][edge.ID] = edge
+        self._revision += 1
         return edge
 
+    def AddEdgesFrom(self, edges):
+        """
+        Adds many edges at once, as .AddEdge would add each of them.
+        The edges are validated together with set operations, then the adjacency is filled in a single pass.
+        Raises the exceptions of .AddEdge before anything is added if any of the edges is invalid.
+        :param edges: iterable of Edge
+        :return: the list of edges added
+        """
+        with self._pausedCollection():
+            rows = [(e, e.ID, *e.Vertices) for e in edges]
+            rows = [(e, eID, source, target, source.ID, target.ID) for e, eID, source, target in rows]
+            self._addEndpoints(self._validateEdges(rows))
+            self._insertEdges(rows)
+        return [row[0] for row in rows]
+
+    def FromEdgeList(self, sources, targets, ids=None):
+        """
+        Adds an edge from sources[i] to targets[i] for every i. Vertices with IDs which do not exist in the graph are created, as in .Connect
+        :param sources: list or array of vertex IDs
+        :param targets: list or array of vertex IDs
+        :param ids: optional, list or array of edge IDs. Generated if not given
+        :return: self
+        """
+        sources, targets = list(sources), list(targets)
+        ids = list(ids) if ids is not None else [None] * len(sources)
+        if not len(sources) == len(targets) == len(ids): raise Exception("sources, targets and ids must have the same length.")
+        vertices = {vID: self.Vertex(vID) or Vertex(ID=vID) for vID in dict.fromkeys(sources + targets)}
+        self.AddEdgesFrom(Edge(vertices[sID], vertices[tID], ID=ID) for sID, tID, ID in zip(sources, targets, ids))
+        return self
+
     def RemoveEdge(self, edgeID):
         if e := self.__edges.pop(edgeID, None):
             v1, v2 = e.Vertices
@@ -90,6 +149,8 @@ class Graph(Mappable):
             self._removeEmptyConnection(self.__adjacency, v1.ID, v2.ID)
             del self.__adjacency[v2.ID][v1.ID][edgeID]
             self._removeEmptyConnection(self.__adjacency, v2.ID, v1.ID)
+            if self._edgeAttributes is not None: self._edgeAttributes.Remove(e)
+            self._revision += 1
         return e
 
     def Connect(self, vertex1ID, vertex2ID, *, extendFrom=None):
@@ -141,12 +202,68 @@ class Graph(Mappable):
     def GraphDegree(self):
         return max([self.Degree(vID) for vID in self.__vertices], default=0)
 
+    def Freeze(self):
+        """
+        :return: an immutable CSR snapshot of the graph, on which the algorithms run with integer indices, see FrozenGraph
+        """
+        return FrozenGraph(self)
+
     def Copy(self, *, deep: bool = False):
         copy = type(self)(multigraph=self._multigraph)
         [copy.AddVertex(v.Copy() if deep else v) for v in self.Vertices.values()]
         [copy.AddEdge(e.Copy(deep) if deep else e) for e in self.Edges.values()]
         return copy
 
+    def ToDictionary(self, *, includeOnly=None, **kwargs):
+        return {name: dict(x) if isinstance(x, GeneratorType) else x for name, x in self.IterDictionary(includeOnly=includeOnly, **kwargs)}
+
+    def IterDictionary(self, *, includeOnly=None, **kwargs):
+        """
+        Yields the (name, value) items of .ToDictionary one at a time. Dictionaries, such as the vertices and the edges, are
+        yielded as generators of (key, value) items converting each element as it is reached, so the dictionary of the
+        whole graph is never held. See Dictionaries.ExportJSON for writing them.
+        """
+        for name, x in ((name, getattr(self, name)) for name in includeOnly) if includeOnly else self._properties():
+            yield name, ((key, self._serialize(val, kwargs)) for key, val in x.items()) if type(x) is dict else self._serialize(x, kwargs)
+
+    def Records(self):
+        """
+        Yields the graph as flat records, ('Vertex', record) for every vertex and then ('Edge', record) for every edge.
+        An edge record holds the IDs of its endpoints as Source and Target. See Mappable.Record and Dictionaries.ExportNDJSON
+        """
+        for v in self.__vertices.values(): yield 'Vertex', {'ID': v.ID, **v.Record()}
+        for e in self.__edges.values(): yield 'Edge', {'ID': e.ID, 'Source': e.Source.ID, 'Target': e.Target.ID, **e.Record()}
+
+    def FromRecords(self, records, *, chunkSize: int = 10000):
+        """
+        Adds the elements of records as yielded by .Records, e.g. Dictionaries.ImportNDJSON(file), reading chunkSize records at
+        a time. The edges of a chunk are added together with .AddEdgesFrom, so only a chunk of records is held at once.
+        Records of vertices which are in the graph update them. Vertices must come before their edges.
+        :return: self
+        """
+        records = iter(records)
+        while chunk := list(itertools.islice(records, chunkSize)):
+            edges = {}
+            for kind, record in chunk:
+                if (edge := self._fromRecord(kind, dict(record), edges)) is not None: edges[edge.ID] = edge
+            self.AddEdgesFrom(edges.values())
+        return self
+
+    def _fromRecord(self, kind, record, edges):
+        """
+        Adds the element of a record of .Records to the graph, see .FromRecords
+        :param edges: {Edge.ID: Edge} of the edges of the chunk which are not added yet
+        :return: the edge of an edge record, which .FromRecords adds with the other edges of the chunk
+        """
+        if kind == 'Vertex':
+            if v := self.Vertex(ID := record.pop('ID')): v.FromRecord(record)
+            else: self.AddVertex(Vertex(ID=ID).FromRecord(record))
+            return None
+        if kind == 'Edge':
+            source, target = self.Vertex(record.pop('Source')), self.Vertex(record.pop('Target'))
+            return Edge(source, target, ID=record.pop('ID')).FromRecord(record)
+        raise Exception(f"Unknown record of kind {kind}.")
+
     def FromDictionary(self, data):
         for edge in data.get('Edges', {}).values():
             sData, tData = edge['Source'], edge['Target']
@@ -156,7 +273,60 @@ class Graph(Mappable):
         [self.Vertex(v['ID']).UpdateFromDictionary(v) for v in data.get('Vertices', {}).values()]
         return self
 
+    def _validateEdges(self, rows):
+        """
+        Raises the exceptions of .AddEdge for a batch of edges.
+        :param rows: [(edge, edgeID, source, target, sourceID, targetID)] of the edges, see .AddEdgesFrom
+        :return: the endpoints of the edges which are not in the graph
+        """
+        ids = [row[1] for row in rows]
+        if len(set(ids)) < len(ids) or not self.__edges.keys().isdisjoint(ids):
+            raise Exception("The graph already contains an edge with this ID.")
+        if not self._multigraph:
+            if len({frozenset(row[4:]) for row in rows}) < len(rows) or any(self.AreConnected(sID, tID) for *_, sID, tID in rows):
+                raise Exception("Graph is not a multigraph and an edge already exists between vertices")
+        endpoints = {}
+        for v, vID in ((v, vID) for _, _, source, target, sID, tID in rows for v, vID in ((source, sID), (target, tID))):
+            if endpoints.setdefault(vID, self.__vertices.get(vID, v)) is not v:
+                raise Exception("IDs of endpoints already in the graph but on different objects. You can use .Connect with extendFrom= but the edge would not be the same object.")
+        return [v for vID, v in endpoints.items() if vID not in self.__vertices]
+
+    def _addEndpoints(self, vertices):
+        [self.AddVertex(v) for v in vertices]
+
+    def _insertEdges(self, rows):
+        """
+        Fills a batch of validated edges into the adjacency, see .AddEdgesFrom
+        """
+        if self._edgeAttributes is not None: [self._edgeAttributes.Add(row[0]) for row in rows]
+        self.__edges.update((row[1], row[0]) for row in rows)
+        self._fillAdjacency(self.__adjacency, rows, 4, 5)
+        self._fillAdjacency(self.__adjacency, rows, 5, 4)
+        self._revision += 1
+
+    @staticmethod
+    @contextmanager
+    def _pausedCollection():
+        """
+        Pauses garbage collection while a batch is added. The batch only allocates, so collection passes while it is
+        filled would scan the growing graph for nothing.
+        """
+        collecting = gc.isenabled()
+        gc.disable()
+        try: yield
+        finally:
+            if collecting: gc.enable()
+
+    @staticmethod
+    def _fillAdjacency(adjacency, rows, vertex, neighbor):
+        """
+        Adds adjacency[row[vertex]][row[neighbor]][edgeID] = edge for every row of .AddEdgesFrom
+        """
+        for row in rows:
+            if (edgeMap := (vertexMap := adjacency[row[vertex]]).get(row[neighbor])) is None: edgeMap = vertexMap[row[neighbor]] = {}
+            edgeMap[row[1]] = row[0]
+
     @staticmethod
     def _removeEmptyConnection(d, v1ID, v2ID):
-        if d[v1ID, {}].get(v2ID, None):
+        if not d.get(v1ID, {}).get(v2ID, True):
             del d[v1ID][v2ID]
@@ -1,8 +1,21 @@
+import heapq
+import math
+import numpy as np
 from inograph.classes.edges.Channel import Channel
 from inograph.classes.edges.Interference import Interference
 from inograph.classes.edges.Link import Link
+from inograph.classes.graphs.NetworkSnapshot import NetworkSnapshot
 from inograph.classes.vertices.Site import Site
 from inograph.modules.data.Dictionaries import ListDictionaryValues
+from inograph.modules.data.Tables import IDList, LinkRows, LinkTableColumns, ReadTable, SiteRows
+from inograph.modules.mathematics.FrequencyIndex import FrequencyIndex
+from inograph.modules.mathematics.FrequencyPlans import PlanEvaluator
+from inograph.modules.mathematics.Geometry import GlobeDistance
+from inograph.modules.mathematics.InterferenceMatrix import ChannelArrays, InterferenceLevels, InterferenceStore, \
+    AggregateInterference, SignalLevels, TiledInterference
+from inograph.modules.mathematics.RF import AggregateSINR, AttenuationDistance, Capacity as ChannelCapacity, DBtoMW, \
+    FrequencyRejection, FSPL
+from inograph.modules.mathematics.SpatialIndex import GridIndex
 
 
 def NetworkClass(topology, *topologyArgs, **topologyKWArgs):
@@ -16,29 +29,167 @@ def NetworkClass(topology, *topologyArgs, **topologyKWArgs):
             """
             topologyKWArgs['multigraph'] = False
             super().__init__(*topologyArgs, **topologyKWArgs)
+            self.__channels = {}  # {(Link.ID, Channel.ID): Channel}
+            self.__channelList = None  # list of the values of __channels, dropped when channels are added or removed
+            self.__siteIndex = GridIndex()
+            self.__frequencyIndex = FrequencyIndex()
+            self.__interferenceStore = None
 
         @property
         def Channels(self) -> list[Channel]:
             """
-            :return: each channel of every link in the network.
+            :return: each channel of every link in the network. The list is kept until channels are added or removed, do not modify it
             """
-            return [channel for link in self.Edges.values() for channel in link.Channels.values()]
+            if self.__channelList is None: self.__channelList = list(self.__channels.values())
+            return self.__channelList
 
-        def Interferences(self, *, asMap=False, includeSelfInterference=False):
+        def Interferences(self, *, asMap=False, includeSelfInterference=False, maxDistance=None, minLevel=None, adjacentRejection=None,
+                          workers=None, tileSize=1.0):
             """
             Returns all interference between links in the network
             :param asMap: Changes type of output to map
             :param includeSelfInterference: will include interference between a link and itself
-            :return: list[Interference] if asMap else {Link.ID: {Link.ID: Interference}}
-            """
-            interferences = {}
-            for sourceLink in self.Links:
-                interferences[sourceLink.ID] = {}
-                for targetLink in self.Links:
-                    if not includeSelfInterference and sourceLink.ID == targetLink.ID: continue
-                    interferences[sourceLink.ID][targetLink.ID] = self.InterferenceFromOn(sourceLink.ID, targetLink.ID)
+            :param maxDistance: optional, only interference travelling at most maxDistance kilometers is computed
+            :param minLevel: optional, only interference with RxLevel of at least minLevel is returned
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
+            :param workers: optional, number of processes computing the RxLevels geographic tile by tile, see
+                            InterferenceMatrix.TiledInterference. Tiles only shrink the work when maxDistance or minLevel are given
+            :param tileSize: the size of a tile in degrees, used with workers
+            :return: {Link.ID: {Link.ID: list[Interference]}}, holding only the links interfered with, if asMap else list[Interference]
+            """
+            if workers:
+                interferences = self.__tiledInterferences(includeSelfInterference, maxDistance, minLevel, adjacentRejection, workers, tileSize)
+                return interferences if asMap else ListDictionaryValues(interferences)
+            maxRxGain = max((c.RxGain for c in self.__channels.values()), default=None)
+            interferences = {link.ID: self.__interferencesFrom(link, includeSelfInterference, maxRxGain, maxDistance, minLevel, adjacentRejection)
+                             for link in self.Links.values()}
             return interferences if asMap else ListDictionaryValues(interferences)
 
+        def InterferenceMatrix(self, *, includeSelfInterference=False, adjacentRejection=None):
+            """
+            Computes the interference between every pair of channels in the network in one vectorized pass.
+            Equivalent to reading Interference.RxLevel of every element of .Interferences, without building the objects.
+            :param includeSelfInterference: will include interference between channels of the same link
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
+            :return: (keys, matrix) where keys is a list of (Link.ID, Channel.ID) and matrix[i][j] is the RxLevel, in dBm,
+                     of the interference of channel keys[i] on channel keys[j]. Pairs not computed are -inf.
+            """
+            channels = ChannelArrays(self.__channels.values())
+            return channels.Keys, InterferenceLevels(channels, includeSelfInterference=includeSelfInterference,
+                                                     adjacentRejection=adjacentRejection)
+
+        def SINR(self, *, asMap=False, workers=None, adjacentRejection=None):
+            """
+            Computes the SINR of every channel, against the interference of all other links and the channel's NoiseLevel summed in mW.
+            :param asMap: Changes type of output to map
+            :param workers: optional, number of processes to split the interference computation across
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
+            :return: (keys, array) where keys is a list of (Link.ID, Channel.ID) and array[i] is the SINR, in DB, of channel keys[i]
+                     or {(Link.ID, Channel.ID): SINR} if asMap
+            """
+            channels = ChannelArrays(self.__channels.values())
+            sinr = self.__sinr(channels, workers, adjacentRejection)
+            return dict(zip(channels.Keys, sinr.tolist())) if asMap else (channels.Keys, sinr)
+
+        def Capacity(self, *, asMap=False, workers=None, adjacentRejection=None):
+            """
+            Computes the capacity of every channel from its SINR, see .SINR
+            :param asMap: Changes type of output to map
+            :param workers: optional, number of processes to split the interference computation across
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
+            :return: (keys, array) where keys is a list of (Link.ID, Channel.ID) and array[i] is the capacity of channel keys[i]
+                     or {(Link.ID, Channel.ID): capacity} if asMap
+            """
+            channels = ChannelArrays(self.__channels.values())
+            capacity = ChannelCapacity(DBtoMW(self.__sinr(channels, workers, adjacentRejection)), channels.Bandwidth)
+            return dict(zip(channels.Keys, capacity.tolist())) if asMap else (channels.Keys, capacity)
+
+        def FromTable(self, table, *, columns: dict = None):
+            """
+            Adds the sites, links and channels of a link inventory with one row per channel, see LinkTableColumns.
+            Sites are the distinct endpoint locations, found by grouping the table on latitude and longitude, and rows between
+            the same two sites are the channels of one link. Rows whose channel columns are all empty add a link without channels.
+            The links are added together with .AddEdgesFrom.
+            :param table: DataFrame, or a CSV / Parquet / Excel file
+            :param columns: optional, {key of LinkTableColumns: column name} replacing the default column names
+            :return: self
+            """
+            import pandas as pd
+            table = table if isinstance(table, pd.DataFrame) else ReadTable(table)
+            columns = {key: name for key, name in {**LinkTableColumns, **(columns or {})}.items() if name in table.columns}
+            sourceLocations = table[[columns['SourceLatitude'], columns['SourceLongitude']]].to_numpy(dtype=float)
+            targetLocations = table[[columns['TargetLatitude'], columns['TargetLongitude']]].to_numpy(dtype=float)
+            first, sources, targets = SiteRows(sourceLocations, targetLocations)
+            locations = np.concatenate([sourceLocations, targetLocations])[first].tolist()
+            siteIDs = [None] * len(first)
+            if 'SourceID' in columns and 'TargetID' in columns:
+                endpointIDs = IDList(table[columns['SourceID']]) + IDList(table[columns['TargetID']])
+                siteIDs = [endpointIDs[i] for i in first.tolist()]
+            linkOf, firstRows = LinkRows(sources, targets)
+            linkIDs = IDList(table[columns['LinkID']].to_numpy()[firstRows]) if 'LinkID' in columns else [None] * len(firstRows)
+            parameters = {key: table[columns[key]].tolist() for key in ['Frequency', 'Bandwidth', 'TxLevel', 'TxGain', 'RxGain']
+                          if key in columns}
+            if 'ChannelID' in columns: parameters['ChannelID'] = IDList(table[columns['ChannelID']])
+            sources, targets = sources.tolist(), targets.tolist()
+            with self._pausedCollection():
+                sites = [self.Site(ID) or Site(tuple(location), ID=ID) for ID, location in zip(siteIDs, locations)]
+                links = [Link(sites[sources[i]], sites[targets[i]], ID=ID) for i, ID in zip(firstRows.tolist(), linkIDs)]
+                for i, link in enumerate(linkOf.tolist()):
+                    row = {key: values[i] for key, values in parameters.items() if values[i] is not None and not pd.isna(values[i])}
+                    if not row: continue
+                    links[link].AddChannel(Channel(links[link], ID=row.pop('ChannelID', None), **{
+                        {'Frequency': 'frequency', 'Bandwidth': 'bandwidth'}.get(key, key): value for key, value in row.items()}))
+                self.AddEdgesFrom(links)
+            return self
+
+        def ToTable(self):
+            """
+            :return: DataFrame of the network with one row per channel, and a row with empty channel columns per link without
+                     channels, in the columns of LinkTableColumns. See .FromTable
+            """
+            import pandas as pd
+            rows = [(link, channel) for link in self.Links.values() for channel in (link.Channels.values() or [None])]
+            table = {'LinkID': [link.ID for link, _ in rows], 'ChannelID': [None if channel is None else channel.ID for _, channel in rows]}
+            for end in ['Source', 'Target']:
+                sites = [getattr(link, end) for link, _ in rows]
+                table[f'{end}ID'] = [site.ID for site in sites]
+                locations = np.array([site.Location for site in sites], dtype=float).reshape(-1, 2)
+                table[f'{end}Latitude'], table[f'{end}Longitude'] = locations[:, 0], locations[:, 1]
+            for key in ['Frequency', 'Bandwidth', 'TxLevel', 'TxGain', 'RxGain']:
+                table[key] = np.array([np.nan if channel is None else getattr(channel, key) for _, channel in rows], dtype=float)
+            return pd.DataFrame({LinkTableColumns[key]: table[key] for key in LinkTableColumns})
+
+        def SaveSnapshot(self, file):
+            """
+            Writes the network to a binary file which later processes open with NetworkSnapshot(file) without parsing it,
+            see NetworkSnapshot.
+            :return: NetworkSnapshot of the file
+            """
+            return NetworkSnapshot.Write(self, file)
+
+        def PlanEvaluator(self, *, adjacentRejection=None):
+            """
+            Captures the current geometry of the network to score candidate frequency/power plans of its channels,
+            see PlanEvaluator.Evaluate. Later edits of sites and links are not reflected in the returned evaluator.
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
+            :return: PlanEvaluator whose .Keys orders the channels of the plans, as in .SINR
+            """
+            return PlanEvaluator(ChannelArrays(self.__channels.values()), adjacentRejection=adjacentRejection)
+
+        def InterferenceStore(self) -> InterferenceStore:
+            """
+            The interference store of the network. Created on first call, then kept current by every edit of
+            the network's sites, links and channels, recomputing only the channels affected by each edit.
+            """
+            if self.__interferenceStore is None: self.__interferenceStore = InterferenceStore(self.__channels.values())
+            return self.__interferenceStore
+
+        def AggregateInterference(self, linkID=None, channelID=None):
+            """
+            :return: the total interference, in dBm, on a channel, or {(Link.ID, Channel.ID): level} of every channel if no IDs are given
+            """
+            return self.InterferenceStore().Aggregate((linkID, channelID) if linkID is not None else None)
+
         @property
         def Links(self):
             return self.Edges
@@ -50,39 +201,102 @@ def NetworkClass(topology, *topologyArgs, **topologyKWArgs):
             link = self.Link(linkID)
             return link.Channel(channelID) if link else None
 
-        def InterferenceFrom(self, linkID, *, includeSelfInterference=False):
+        def InterferenceFrom(self, linkID, *, includeSelfInterference=False, maxDistance=None, minLevel=None, adjacentRejection=None):
             """
             Returns all interference from a link with ID linkID to all links in the network
             :param linkID: The ID of the required link
             :param includeSelfInterference: will include interference between the link and itself
+            :param maxDistance: optional, only interference travelling at most maxDistance kilometers is computed
+            :param minLevel: optional, only interference with RxLevel of at least minLevel is returned
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
             :return: list[Interference]
             """
-            if not self.Link(linkID): return None
-            interferences = []
-            [interferences.extend(self.InterferenceFromOn(linkID, link.ID)) for link in self.Links
-             if includeSelfInterference or linkID != link.ID]
-            return interferences
+            if not (link := self.Link(linkID)): return None
+            maxRxGain = max((c.RxGain for c in self.__channels.values()), default=None)
+            return ListDictionaryValues(self.__interferencesFrom(link, includeSelfInterference, maxRxGain, maxDistance, minLevel, adjacentRejection))
 
-        def InterferenceOn(self, linkID, *, includeSelfInterference=False):
+        def InterferenceOn(self, linkID, *, includeSelfInterference=False, maxDistance=None, minLevel=None, adjacentRejection=None):
             """
             Returns all interference from all links in the network to a link with ID linkID
             :param linkID: The ID of the required link
             :param includeSelfInterference: will include interference between the link and itself
+            :param maxDistance: optional, only interference travelling at most maxDistance kilometers is computed
+            :param minLevel: optional, only interference with RxLevel of at least minLevel is returned
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
             :return: list[Interference]
             """
-            if not self.Link(linkID): return None
+            if not (link := self.Link(linkID)): return None
+            origins = self.__bandNeighbors(link.Channels.values(), adjacentRejection)
+            maxRxGain = max((c.RxGain for c in link.Channels.values()), default=None)
+            radius = self.__interferenceRadius(ListDictionaryValues(origins), maxRxGain, maxDistance, minLevel)
+            near = self.__linkIDsNear(link.Target.ID, 'Source', radius)
+            interferences = []
+            [interferences.extend(self.__interferencesBetween(channels, link.Channels.values(), adjacentRejection))
+             for originID, channels in origins.items()
+             if (includeSelfInterference or linkID != originID) and (near is None or originID in near)]
+            return self.__filterLevel(interferences, minLevel)
+
+        def TopInterferers(self, linkID, k, *, includeSelfInterference=False, adjacentRejection=None):
+            """
+            Returns the k strongest interferences on a link with ID linkID.
+            Pairs are visited in descending order of an upper bound of their RxLevel, and the search stops once no remaining
+            bound can beat the k-th strongest interference found, so most RxLevels are never computed.
+            :param includeSelfInterference: will include interference between the link and itself
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
+            :return: list[Interference] ordered by descending RxLevel
+            """
+            if not (link := self.Link(linkID)): return None
+            if k <= 0: return []
+            interferedChannels = list(link.Channels.values())
+            pairs = [pair for originID, channels in self.__bandNeighbors(interferedChannels, adjacentRejection).items()
+                     if includeSelfInterference or originID != linkID
+                     for pair in self.__boundedPairs(channels, interferedChannels, adjacentRejection)]
+            pairs.sort(key=lambda pair: pair[0], reverse=True)
+            top = []  # min-heap of (RxLevel, order, Interference)
+            for order, (bound, origin, interfered, rejection) in enumerate(pairs):
+                if len(top) >= k and bound <= top[0][0]: break
+                interference = Interference(origin, interfered, rejection=rejection)
+                item = (interference.RxLevel, -order, interference)
+                if len(top) < k: heapq.heappush(top, item)
+                elif item[:2] > top[0][:2]: heapq.heapreplace(top, item)
+            return [interference for *_, interference in sorted(top, key=lambda item: item[:2], reverse=True)]
+
+        def InterferencesAbove(self, threshold, *, includeSelfInterference=False, adjacentRejection=None):
+            """
+            Returns all interference between links in the network with RxLevel of at least threshold.
+            Links beyond the distance at which their strongest channel attenuates to threshold are skipped through the
+            spatial index, and the remaining pairs are skipped when an upper bound of their RxLevel is below threshold.
+            :param threshold: in dBm
+            :param includeSelfInterference: will include interference between a link and itself
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
+            :return: list[Interference] ordered by descending RxLevel
+            """
+            maxRxGain = max((c.RxGain for c in self.__channels.values()), default=None)
             interferences = []
-            [interferences.extend(self.InterferenceFromOn(link.ID, linkID)) for link in self.Links
-             if includeSelfInterference or linkID != link.ID]
+            for link in self.Links.values():
+                originChannels = list(link.Channels.values())
+                radius = self.__interferenceRadius(originChannels, maxRxGain, None, threshold)
+                near = self.__linkIDsNear(link.Source.ID, 'Target', radius)
+                interferences.extend(interference for targetID, channels in self.__bandNeighbors(originChannels, adjacentRejection).items()
+                                     if (includeSelfInterference or targetID != link.ID) and (near is None or targetID in near)
+                                     for bound, origin, interfered, rejection in self.__boundedPairs(originChannels, channels, adjacentRejection)
+                                     if bound >= threshold
+                                     and (interference := Interference(origin, interfered, rejection=rejection)).RxLevel >= threshold)
+            interferences.sort(key=lambda interference: interference.RxLevel, reverse=True)
             return interferences
 
-        def InterferenceFromOn(self, linkID1, linkID2):
+        def InterferenceFromOn(self, linkID1, linkID2, *, adjacentRejection=None):
+            """
+            Returns the interference between the channels of link1 and the channels of link2 whose frequency bands overlap
+            :param adjacentRejection: optional, the rejection in DB of adjacent channels. Adjacent channels are skipped if not given
+            :return: list[Interference]
+            """
             link1, link2 = self.Link(linkID1), self.Link(linkID2)
-            return [Interference(sourceChannel, targetChannel) for sourceChannel in link1.Channels for targetChannel in link2.Channels]
+            return self.__interferencesBetween(link1.Channels.values(), link2.Channels.values(), adjacentRejection)
 
-        def InterferenceBetween(self, linkID1, linkID2):
-            interferences = self.InterferenceFromOn(linkID1, linkID2)
-            if interferences: interferences.extend(self.InterferenceFromOn(linkID2, linkID1))
+        def InterferenceBetween(self, linkID1, linkID2, *, adjacentRejection=None):
+            interferences = self.InterferenceFromOn(linkID1, linkID2, adjacentRejection=adjacentRejection)
+            if interferences: interferences.extend(self.InterferenceFromOn(linkID2, linkID1, adjacentRejection=adjacentRejection))
             return interferences
 
         def GetLinkBetween(self, site1ID, site2ID):
@@ -95,24 +309,71 @@ def NetworkClass(topology, *topologyArgs, **topologyKWArgs):
         def Site(self, siteID):
             return self.Vertex(siteID)
 
+        def SitesNear(self, location, distance):
+            """
+            :return: the sites at most distance kilometers away from location, found through the network's spatial index
+            """
+            return [self.Site(siteID) for siteID in self.__siteIndex.Within(location, distance)]
+
         def AddSite(self, site: Site = None, **kwargs):
             return self.AddVertex(site, **kwargs)
 
         def AddVertex(self, vertex: Site = None, **kwargs):
-            return super().AddVertex(vertex, **kwargs)
+            v = super().AddVertex(vertex, **kwargs)
+            if isinstance(v, Site):
+                self.__siteIndex.Insert(v.ID, v.Location)
+                v.Subscribe(self.__onSiteChanged)
+            return v
 
         def RemoveSite(self, siteID):
             return self.RemoveVertex(siteID)
 
         def RemoveVertex(self, vertexID):
-            return super().RemoveVertex(vertexID)
+            v, es = super().RemoveVertex(vertexID)
+            if isinstance(v, Site):
+                self.__siteIndex.Remove(v.ID)
+                v.Unsubscribe(self.__onSiteChanged)
+            return v, es
 
         def AddLink(self, link: Link, **kwargs):
             return self.AddEdge(link, **kwargs)
 
+        def AddEdge(self, edge: Link, **kwargs):
+            e = super().AddEdge(edge, **kwargs)
+            if isinstance(e, Link): self.__onLinkAdded(e)
+            return e
+
+        def FromEdgeList(self, sources, targets, ids=None):
+            """
+            Adds a link from sources[i] to targets[i] for every i. The sites must already be in the network
+            :param sources: list or array of site IDs
+            :param targets: list or array of site IDs
+            :param ids: optional, list or array of link IDs. Generated if not given
+            :return: self
+            """
+            sources, targets = list(sources), list(targets)
+            ids = list(ids) if ids is not None else [None] * len(sources)
+            if not len(sources) == len(targets) == len(ids): raise Exception("sources, targets and ids must have the same length.")
+            if missing := set(sources + targets) - self.Sites.keys(): raise Exception(f"Sites {missing} are not in the network.")
+            self.AddEdgesFrom(Link(self.Site(sID), self.Site(tID), ID=ID) for sID, tID, ID in zip(sources, targets, ids))
+            return self
+
+        def _insertEdges(self, rows):
+            super()._insertEdges(rows)
+            links = [row[0] for row in rows if isinstance(row[0], Link)]
+            [link.Subscribe(self.__onLinkChanged) for link in links]
+            self.__onChannelsAdded([channel for link in links for channel in link.Channels.values()])
+
         def RemoveLink(self, linkID):
             return self.RemoveEdge(linkID)
 
+        def RemoveEdge(self, edgeID):
+            e = super().RemoveEdge(edgeID)
+            if isinstance(e, Link):
+                e.Unsubscribe(self.__onLinkChanged)
+                [self.__onChannelRemoved(channel) for channel in e.Channels.values()]
+            return e
+
         def AddChannel(self, linkID, channel: Channel):
             link = self.Link(linkID)
             return None if not link else link.AddChannel(channel)
@@ -129,4 +390,166 @@ def NetworkClass(topology, *topologyArgs, **topologyKWArgs):
             [self.Site(v['ID']).UpdateFromDictionary(v) for v in data.get('Vertices', {}).values()]
             return self
 
+        def Records(self):
+            """
+            Yields the network as flat records: ('Site', record) for every site, then ('Link', record) for every link, each
+            followed by ('Channel', record) for its channels. A channel record holds the ID of its link as Link.
+            See Graph.Records and Graph.FromRecords
+            """
+            for kind, record in super().Records():
+                if kind == 'Vertex' and isinstance(self.Site(record['ID']), Site): yield 'Site', record
+                elif kind == 'Edge' and isinstance(link := self.Link(record['ID']), Link):
+                    yield 'Link', record
+                    for channel in link.Channels.values(): yield 'Channel', {'ID': channel.ID, 'Link': link.ID, **channel.Record()}
+                else: yield kind, record
+
+        def _fromRecord(self, kind, record, edges):
+            if kind == 'Site':
+                if site := self.Site(ID := record.pop('ID')): site.FromRecord(record)
+                else: self.AddSite(Site(tuple(record.pop('Location')), ID=ID).FromRecord(record))
+                return None
+            if kind == 'Link':
+                source, target = self.Site(record.pop('Source')), self.Site(record.pop('Target'))
+                return Link(source, target, ID=record.pop('ID')).FromRecord(record)
+            if kind == 'Channel':
+                link = edges.get(linkID := record.pop('Link')) or self.Link(linkID)
+                link.AddChannel(Channel(link, ID=record.pop('ID')).FromRecord(record))
+                return None
+            return super()._fromRecord(kind, record, edges)
+
+        def __onSiteChanged(self, site, propertyName, _):
+            if propertyName != 'Location': return
+            self.__siteIndex.Insert(site.ID, site.Location)
+            [self.__onChannelChanged(channel, propertyName, None)
+             for link in self.AdjacentEdgeList(site.ID) or [] for channel in link.Channels.values()]
+
+        def __onLinkAdded(self, link):
+            link.Subscribe(self.__onLinkChanged)
+            [self.__onChannelAdded(channel) for channel in link.Channels.values()]
+
+        def __onLinkChanged(self, link, propertyName, channel):
+            if propertyName != 'Channels': return
+            if link.Channel(channel.ID) is channel: self.__onChannelAdded(channel)
+            else: self.__onChannelRemoved(channel)
+
+        def __onChannelAdded(self, channel):
+            key = (channel.Link.ID, channel.ID)
+            self.__channels[key] = channel
+            self.__channelList = None
+            self.__frequencyIndex.Insert(key, channel.Frequency, channel.Bandwidth)
+            channel.Subscribe(self.__onChannelChanged)
+            if self.__interferenceStore is not None: self.__interferenceStore.Add(channel)
+
+        def __onChannelsAdded(self, channels):
+            """
+            .__onChannelAdded for a batch of channels, indexing their bands together
+            """
+            keys = [(channel.Link.ID, channel.ID) for channel in channels]
+            self.__channels.update(zip(keys, channels))
+            self.__channelList = None
+            self.__frequencyIndex.InsertMany((key, channel.Frequency, channel.Bandwidth) for key, channel in zip(keys, channels))
+            [channel.Subscribe(self.__onChannelChanged) for channel in channels]
+            if self.__interferenceStore is not None: [self.__interferenceStore.Add(channel) for channel in channels]
+
+        def __onChannelRemoved(self, channel):
+            key = (channel.Link.ID, channel.ID)
+            self.__channels.pop(key, None)
+            self.__channelList = None
+            self.__frequencyIndex.Remove(key)
+            channel.Unsubscribe(self.__onChannelChanged)
+            if self.__interferenceStore is not None: self.__interferenceStore.Remove(channel)
+
+        def __onChannelChanged(self, channel, propertyName, _):
+            if propertyName in ['Frequency', 'Bandwidth']:
+                self.__frequencyIndex.Insert((channel.Link.ID, channel.ID), channel.Frequency, channel.Bandwidth)
+            if self.__interferenceStore is not None: self.__interferenceStore.Invalidate(channel)
+
+        def __interferencesFrom(self, link, includeSelfInterference, maxRxGain, maxDistance, minLevel, adjacentRejection):
+            """
+            :return: {Link.ID: list[Interference]} of the interference from link on every link it interferes with
+            """
+            targets = self.__bandNeighbors(link.Channels.values(), adjacentRejection)
+            radius = self.__interferenceRadius(link.Channels.values(), maxRxGain, maxDistance, minLevel)
+            near = self.__linkIDsNear(link.Source.ID, 'Target', radius)
+            return {targetID: interferences for targetID, channels in targets.items()
+                    if (includeSelfInterference or targetID != link.ID) and (near is None or targetID in near)
+                    and (interferences := self.__filterLevel(self.__interferencesBetween(link.Channels.values(), channels,
+                                                                                         adjacentRejection), minLevel))}
+
+        def __tiledInterferences(self, includeSelfInterference, maxDistance, minLevel, adjacentRejection, workers, tileSize):
+            """
+            :return: {Link.ID: {Link.ID: list[Interference]}} as .Interferences, from the RxLevels of InterferenceMatrix.TiledInterference
+            """
+            channels = ChannelArrays(self.__channels.values())
+            origins, targets, levels = TiledInterference(channels, maxDistance=maxDistance, minLevel=minLevel, workers=workers,
+                                                         includeSelfInterference=includeSelfInterference,
+                                                         adjacentRejection=adjacentRejection, tileSize=tileSize)
+            interferences = {link.ID: {} for link in self.Links.values()}
+            for o, t, level in zip(origins.tolist(), targets.tolist(), levels.tolist()):
+                origin, interfered = self.__channels[channels.Keys[o]], self.__channels[channels.Keys[t]]
+                rejection = FrequencyRejection(origin.Frequency, origin.Bandwidth, interfered.Frequency, interfered.Bandwidth,
+                                               adjacentRejection=adjacentRejection)
+                interferences[origin.Link.ID].setdefault(interfered.Link.ID, []).append(
+                    Interference(origin, interfered, rejection=rejection, RxLevel=level))
+            return interferences
+
+        def __bandNeighbors(self, channels, adjacentRejection):
+            """
+            :return: {Link.ID: list[Channel]} of the channels whose band overlaps the band of any of channels, or is adjacent to it
+                     if adjacentRejection is given
+            """
+            guard = self.__frequencyIndex.MaxBandwidth if adjacentRejection is not None else 0
+            neighbors = {}
+            [neighbors.setdefault(key[0], []).append(self.__channels[key]) for key in dict.fromkeys(
+                key for c in channels for key in self.__frequencyIndex.Overlapping(c.Frequency, c.Bandwidth, guard=guard))]
+            return neighbors
+
+        def __linkIDsNear(self, siteID, endpoint, radius):
+            """
+            :param endpoint: 'Source'/'Target', the endpoint of the returned links that must be near the site
+            :return: IDs of the links whose endpoint is at most radius kilometers away from the site with ID siteID, None if radius is None
+            """
+            if radius is None: return None
+            return {link.ID for sID in self.__siteIndex.Within(self.Site(siteID).Location, radius)
+                    for link in self.AdjacentEdgeList(sID) or [] if getattr(link, endpoint).ID == sID}
+
+        @staticmethod
+        def __interferencesBetween(originChannels, interferedChannels, adjacentRejection):
+            return [Interference(o, i, rejection=rejection) for o in originChannels for i in interferedChannels
+                    if (rejection := FrequencyRejection(o.Frequency, o.Bandwidth, i.Frequency, i.Bandwidth,
+                                                        adjacentRejection=adjacentRejection)) != math.inf]
+
+        @staticmethod
+        def __boundedPairs(originChannels, interferedChannels, adjacentRejection):
+            """
+            :param originChannels: channels of a single link
+            :param interferedChannels: channels of a single link
+            :return: [(bound, origin, interfered, rejection)] of the interfering pairs of channels, where bound is an upper bound of
+                     the RxLevel of their interference - the level at angles 0, where RPF leaves the gains at their maximum
+            """
+            if not originChannels or not interferedChannels: return []
+            distance = GlobeDistance(originChannels[0].Source.Location, interferedChannels[0].Target.Location)
+            return [(o.TxLevel - FSPL(o.Frequency, o.TxGain, i.RxGain, distance) - rejection, o, i, rejection)
+                    for o in originChannels for i in interferedChannels
+                    if (rejection := FrequencyRejection(o.Frequency, o.Bandwidth, i.Frequency, i.Bandwidth,
+                                                        adjacentRejection=adjacentRejection)) != math.inf]
+
+        @staticmethod
+        def __sinr(channels, workers, adjacentRejection):
+            interference = AggregateInterference(channels, workers=workers, adjacentRejection=adjacentRejection)
+            return AggregateSINR(SignalLevels(channels), interference, channels.Bandwidth)
+
+        @staticmethod
+        def __interferenceRadius(originChannels, maxRxGain, maxDistance, minLevel):
+            """
+            :return: the distance beyond which no interference from originChannels is computed, None if unbounded
+            """
+            if minLevel is None or maxRxGain is None: return maxDistance
+            radius = max((AttenuationDistance(c.TxLevel, c.TxGain, maxRxGain, c.Frequency, minLevel) for c in originChannels), default=0)
+            return radius if maxDistance is None else min(radius, maxDistance)
+
+        @staticmethod
+        def __filterLevel(interferences, minLevel):
+            return interferences if minLevel is None else [i for i in interferences if i.RxLevel >= minLevel]
+
     return Network
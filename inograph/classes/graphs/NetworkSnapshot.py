@@ -0,0 +1,226 @@
+import json
+import numpy as np
+from inograph.modules.mathematics.InterferenceMatrix import ChannelArrays, InterferenceLevels
+
+MAGIC = b'INOSNAP1'
+ALIGNMENT = 64
+PARAMETERS = ['Frequency', 'Bandwidth', 'TxLevel', 'TxGain', 'RxGain']
+
+
+class NetworkSnapshot:
+    """
+    A network written once to a binary file by .Write (or Network.SaveSnapshot) and opened with numpy.memmap.
+    The file holds packed arrays - site locations, link endpoints, channel links and parameters, and the ID tables - after a
+    JSON header of their offsets, and a JSON section of the dynamic attributes of the elements. Opening a snapshot reads
+    the header only. Arrays are paged in as they are read, and no Site, Link or Channel object is created unless
+    .Records() is used to rebuild the network: NetworkClass(Graph)().FromRecords(snapshot.Records()).
+    Rows are numbered in the order of the network: site i has ID SiteIDs[i] and location SiteLocations[i], link j connects
+    the sites of rows LinkEndpoints[j], and channel k belongs to the link of row ChannelLinks[k].
+    """
+    def __init__(self, file):
+        self.__file = file
+        with open(file, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC: raise Exception(f"{file} is not a network snapshot.")
+            size = int(np.frombuffer(f.read(8), dtype='<u8')[0])
+            header = json.loads(f.read(size))
+        self.__start = NetworkSnapshot.__dataStart(size)
+        self.__arrays = header['Arrays']  # {name: (dtype, shape, offset)}
+        self.__idTypes = header['IDs']  # {'Sites' / 'Links' / 'Channels': 'int' / 'str'}
+        self.__map, self.__mapped = None, {}  # the memmap of the file, {name: array view}
+        self.__ids, self.__indices, self.__attributes = {}, {}, None
+
+    def __len__(self):
+        return len(self.ChannelLinks)
+
+    @property
+    def SiteIDs(self):
+        return self.__decodeIDs('Sites')
+
+    @property
+    def LinkIDs(self):
+        return self.__decodeIDs('Links')
+
+    @property
+    def ChannelIDs(self):
+        return self.__decodeIDs('Channels')
+
+    @property
+    def SiteLocations(self):
+        return self.__array('SiteLocations')
+
+    @property
+    def LinkEndpoints(self):
+        return self.__array('LinkEndpoints')
+
+    @property
+    def ChannelLinks(self):
+        return self.__array('ChannelLinks')
+
+    @property
+    def Keys(self):
+        """
+        :return: the (Link.ID, Channel.ID) key of every channel row
+        """
+        linkIDs = self.LinkIDs
+        return [(linkIDs[link], ID) for link, ID in zip(self.ChannelLinks.tolist(), self.ChannelIDs)]
+
+    def Parameter(self, name):
+        """
+        :param name: Frequency / Bandwidth / TxLevel / TxGain / RxGain
+        :return: the array of the parameter of every channel row
+        """
+        if name not in PARAMETERS: raise Exception(f"{name} is not a channel parameter of the snapshot.")
+        return self.__array(name)
+
+    def Location(self, siteID):
+        if (i := self.__index('Sites').get(siteID)) is None: return None
+        return tuple(self.SiteLocations[i].tolist())
+
+    def Endpoints(self, linkID):
+        """
+        :return: (Source.ID, Target.ID) of the link
+        """
+        if (j := self.__index('Links').get(linkID)) is None: return None
+        siteIDs = self.SiteIDs
+        return tuple(siteIDs[i] for i in self.LinkEndpoints[j].tolist())
+
+    def Attributes(self, kind, ID):
+        """
+        :param kind: 'Sites' / 'Links' / 'Channels'
+        :param ID: the ID of the element, (Link.ID, Channel.ID) for channels
+        :return: dictionary of the dynamic attributes of the element, None if it is not in the snapshot
+        """
+        if (row := self.__index(kind).get(ID)) is None: return None
+        return dict(self.__attributesOf(kind).get(str(row), {}))
+
+    def ChannelArrays(self):
+        """
+        :return: ChannelArrays of the channels of the snapshot, for the vectorized computations of InterferenceMatrix
+        """
+        locations, endpoints = self.SiteLocations, self.LinkEndpoints[self.ChannelLinks]
+        return ChannelArrays.FromArrays(self.Keys, self.ChannelLinks, locations[endpoints[:, 0]], locations[endpoints[:, 1]],
+                                        *(self.__array(name) for name in PARAMETERS))
+
+    def InterferenceMatrix(self, *, includeSelfInterference=False, adjacentRejection=None):
+        """
+        Computes the interference between every pair of channels of the snapshot, as Network.InterferenceMatrix
+        :return: (keys, matrix) where keys is a list of (Link.ID, Channel.ID) and matrix[i][j] is the RxLevel, in dBm,
+                 of the interference of channel keys[i] on channel keys[j]
+        """
+        channels = self.ChannelArrays()
+        return channels.Keys, InterferenceLevels(channels, includeSelfInterference=includeSelfInterference,
+                                                 adjacentRejection=adjacentRejection)
+
+    def Records(self):
+        """
+        Yields the network as the records of Network.Records, to rebuild it with Graph.FromRecords
+        """
+        attributes = {kind: self.__attributesOf(kind) for kind in ['Sites', 'Links', 'Channels']}
+        siteIDs, linkIDs, channelIDs = self.SiteIDs, self.LinkIDs, self.ChannelIDs
+        for i, (ID, location) in enumerate(zip(siteIDs, self.SiteLocations.tolist())):
+            yield 'Site', {'ID': ID, 'Location': location, **attributes['Sites'].get(str(i), {})}
+        channelsOf = {}
+        [channelsOf.setdefault(j, []).append(k) for k, j in enumerate(self.ChannelLinks.tolist())]
+        parameters = list(zip(*(self.__array(name).tolist() for name in PARAMETERS)))
+        for j, (ID, (s, t)) in enumerate(zip(linkIDs, self.LinkEndpoints.tolist())):
+            yield 'Link', {'ID': ID, 'Source': siteIDs[s], 'Target': siteIDs[t], **attributes['Links'].get(str(j), {})}
+            for k in channelsOf.get(j, []):
+                yield 'Channel', {'ID': channelIDs[k], 'Link': ID, **dict(zip(PARAMETERS, parameters[k])),
+                                  **attributes['Channels'].get(str(k), {})}
+
+    @staticmethod
+    def Write(network, file):
+        """
+        Writes a snapshot of a network to file. IDs must be all integers or all strings for each of sites, links and channels.
+        :return: NetworkSnapshot of the file
+        """
+        sites, links = list(network.Sites.values()), list(network.Links.values())
+        channels = [channel for link in links for channel in link.Channels.values()]
+        siteIndex, linkIndex = {site.ID: i for i, site in enumerate(sites)}, {link.ID: j for j, link in enumerate(links)}
+        arrays = {'SiteLocations': np.array([site.Location for site in sites], dtype=float).reshape(-1, 2),
+                  'LinkEndpoints': np.array([(siteIndex[link.Source.ID], siteIndex[link.Target.ID]) for link in links],
+                                            dtype=np.int64).reshape(-1, 2),
+                  'ChannelLinks': np.array([linkIndex[channel.Link.ID] for channel in channels], dtype=np.int64),
+                  **{name: np.array([getattr(channel, name) for channel in channels], dtype=float) for name in PARAMETERS}}
+        idTypes = {}
+        for kind, elements in [('Sites', sites), ('Links', links), ('Channels', channels)]:
+            idTypes[kind], ids = NetworkSnapshot.__encodeIDs([e.ID for e in elements])
+            arrays.update({f'{kind}{name}': a for name, a in ids.items()})
+        attributes = {kind: {str(i): record for i, e in enumerate(elements)
+                             if (record := {name: x for name, x in e.Record().items() if name not in exclude})}
+                      for kind, elements, exclude in [('Sites', sites, {'Location'}), ('Links', links, ()),
+                                                      ('Channels', channels, set(PARAMETERS))]}
+        arrays['Attributes'] = np.frombuffer(json.dumps(attributes).encode(), dtype=np.uint8)
+        NetworkSnapshot.__writeArrays(file, arrays, idTypes)
+        return NetworkSnapshot(file)
+
+    @staticmethod
+    def __encodeIDs(ids):
+        """
+        :return: ('int', {'IDs': array}) for integer IDs, ('str', {'IDData': utf-8 bytes, 'IDOffsets': array}) for strings
+        """
+        if all(type(ID) is int for ID in ids): return 'int', {'IDs': np.array(ids, dtype=np.int64)}
+        if not all(type(ID) is str for ID in ids): raise Exception("Snapshot IDs must be all integers or all strings.")
+        encoded = [ID.encode() for ID in ids]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        return 'str', {'IDData': np.frombuffer(b''.join(encoded), dtype=np.uint8), 'IDOffsets': offsets}
+
+    @staticmethod
+    def __writeArrays(file, arrays, idTypes):
+        layout, offset = {}, 0
+        for name, a in arrays.items():
+            layout[name] = (a.dtype.str, list(a.shape), offset)
+            offset += -(-a.nbytes // ALIGNMENT) * ALIGNMENT
+        header = json.dumps({'Arrays': layout, 'IDs': idTypes}).encode()
+        start = NetworkSnapshot.__dataStart(len(header))
+        with open(file, 'wb') as f:
+            f.write(MAGIC)
+            f.write(np.array([len(header)], dtype='<u8').tobytes())
+            f.write(header)
+            for name, a in arrays.items():
+                f.seek(start + layout[name][2])
+                f.write(np.ascontiguousarray(a).tobytes())
+            f.truncate(start + offset)
+
+    @staticmethod
+    def __dataStart(headerSize):
+        """
+        :return: the position of the arrays in the file, the offsets of the header are relative to it
+        """
+        return -(-(len(MAGIC) + 8 + headerSize) // ALIGNMENT) * ALIGNMENT
+
+    def __array(self, name):
+        """
+        :return: a read only view of the array name in the memmap of the file
+        """
+        if (a := self.__mapped.get(name)) is not None: return a
+        dtype, shape, offset = self.__arrays[name]
+        if self.__map is None: self.__map = np.memmap(self.__file, dtype=np.uint8, mode='r')
+        start, size = self.__start + offset, int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+        a = self.__mapped[name] = self.__map[start: start + size].view(dtype).reshape(shape)
+        return a
+
+    def __decodeIDs(self, kind):
+        if (ids := self.__ids.get(kind)) is not None: return ids
+        if self.__idTypes[kind] == 'int': ids = self.__array(f'{kind}IDs').tolist()
+        else:
+            data, offsets = self.__array(f'{kind}IDData').tobytes(), self.__array(f'{kind}IDOffsets').tolist()
+            ids = [data[offsets[i]: offsets[i + 1]].decode() for i in range(len(offsets) - 1)]
+        self.__ids[kind] = ids
+        return ids
+
+    def __index(self, kind):
+        """
+        :return: {ID: row} of the elements of kind, channels are keyed by (Link.ID, Channel.ID)
+        """
+        if (index := self.__indices.get(kind)) is None:
+            index = self.__indices[kind] = {ID: i for i, ID in enumerate(self.Keys if kind == 'Channels' else self.__decodeIDs(kind))}
+        return index
+
+    def __attributesOf(self, kind):
+        """
+        :return: {str(row): {name: value}} of the elements of kind which have dynamic attributes
+        """
+        if self.__attributes is None: self.__attributes = json.loads(self.__array('Attributes').tobytes() or b'{}')
+        return self.__attributes.get(kind, {})
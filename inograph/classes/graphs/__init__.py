@@ -1,5 +1,8 @@
-from Graph import Graph
-from BipartiteGraph import BipartiteGraph
-from Forest import Forest
-from Network import NetworkClass
-from Tree import Tree
+from .AttributeStore import AttributeStore
+from .Graph import Graph
+from .BipartiteGraph import BipartiteGraph
+from .Forest import Forest
+from .FrozenGraph import FrozenGraph
+from .Network import NetworkClass
+from .NetworkSnapshot import NetworkSnapshot
+from .Tree import Tree
@@ -0,0 +1,19 @@
+from inograph.classes.abstracts.Identifiable import Identifiable
+from inograph.classes.abstracts.Extendable import CompactExtendable
+from inograph.classes.abstracts.Mappable import Mappable
+
+
+class CompactVertex(Identifiable, CompactExtendable, Mappable):
+    """
+    A Vertex without a __dict__, for graphs with millions of vertices.
+    Combined with Identifiable.SetIDFactory(Identifiable.SequentialIDs()) it takes a fraction of the memory of a Vertex.
+    Dynamic attributes are supported, see CompactExtendable.
+    """
+    __slots__ = ('__weakref__',)
+
+    def __init__(self, *, ID=None):
+        super().__init__(ID)
+
+    def Copy(self):
+        copy = type(self)(ID=self.ID)
+        return copy.UpdateFromObject(self)
@@ -1,7 +1,8 @@
+from inograph.classes.abstracts.Observable import Observable
 from inograph.classes.vertices.Vertex import Vertex
 
 
-class Site(Vertex):
+class Site(Vertex, Observable):
     def __init__(self, location: tuple[float, float], *, ID=None):
         super().__init__(ID=ID)
         self.__location = location
@@ -13,3 +14,4 @@ class Site(Vertex):
     @Location.setter
     def Location(self, location: tuple[float, float]):
         self.__location = location
+        self._notify('Location')
@@ -1,2 +1,3 @@
-from Vertex import Vertex
-from Site import Site
+from .Vertex import Vertex
+from .Site import Site
+from .CompactVertex import CompactVertex
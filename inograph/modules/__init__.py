@@ -1,3 +1,4 @@
-from data.Dictionaries import *
-from graphics.Charts import *
-from graphics.PlotGraphs import *
+from .data.Dictionaries import *
+from .data.Tables import *
+from .graphics.Charts import *
+from .graphics.PlotGraphs import *
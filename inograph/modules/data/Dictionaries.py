@@ -1,6 +1,5 @@
 import json
-import uuid
-import pandas as pd
+from types import GeneratorType
 
 
 def PrintDictionary(d):
@@ -17,30 +16,64 @@ def ListDictionaryValues(d):
 
 
 def ExportJSON(d, file):
-    open(file, "w").write(json.dumps(d))
+    """
+    :param d: a dictionary, or an iterable of (key, value) items such as Graph.IterDictionary(), whose values may be
+              generators of items as well. Items are written as they are generated
+    """
+    with open(file, "w") as f:
+        if type(d) is dict: f.write(json.dumps(d))
+        else: __writeItems(f, d)
+
+
+def __writeItems(f, items):
+    f.write('{')
+    for i, (key, value) in enumerate(items):
+        f.write(f"{', ' if i else ''}{json.dumps(key if isinstance(key, str) else json.dumps(key))}: ")
+        if isinstance(value, GeneratorType): __writeItems(f, value)
+        else: f.write(json.dumps(value))
+    f.write('}')
 
 
 def ImportJSON(file):
     return json.load(open(file, 'r'))
 
 
+def ExportNDJSON(records, file, *, append: bool = False):
+    """
+    Writes records, one per line as {kind: record}, as they are generated.
+    :param records: iterable of (kind, record) such as Graph.Records()
+    :param append: will add the records to the end of the file, for writing it incrementally
+    """
+    with open(file, "a" if append else "w") as f:
+        for kind, record in records:
+            f.write(json.dumps({kind: record}))
+            f.write('\n')
+
+
+def ImportNDJSON(file):
+    """
+    Yields the (kind, record) items of a file written by ExportNDJSON, reading it a line at a time. See Graph.FromRecords
+    """
+    with open(file, 'r') as f:
+        for line in f:
+            if line.strip(): yield next(iter(json.loads(line).items()))
+
+
 def ImportExcelToDictionary(file):
-    df = pd.read_excel(file)
-    Edges, Vertices = {}, {}
-    d = df.iterrows()
-
-    for index, row in d:
-        source, target = str(row['Site A Latitude']) + ';' + str(row['Site A Longitude']), str(row['Site B Latitude']) + ';' + str(row['Site B Longitude'])
-        Vertices[source] = Vertices.get(source, uuid.uuid4().hex)
-        Vertices[target] = Vertices.get(target, uuid.uuid4().hex)
-        Edges[uid] = {'ID': (uid := uuid.uuid4().hex),
-                      'Source': {'ID': Vertices[source], 'Location': (float(row['Site A Latitude']), float(row['Site A Longitude']))},
-                      'Target': {'ID': Vertices[target], 'Location': (float(row['Site B Latitude']), float(row['Site B Longitude']))}
-                      #     'Frequency': row['Site A Frequency']
-                      #     "MaxPt": dBmToMW(float(row['Power'])),
-                      }
-    return {'Edges': Edges}
+    """
+    Reads a link inventory with Network.FromTable, in bulk, and returns its links in the form of Graph.FromDictionary.
+    Rows between the same two sites are one link. IDs are given by the ID factory of Identifiable, see Identifiable.SetIDFactory
+    :param file: a CSV, Parquet or Excel file, see Tables.LinkTableColumns
+    """
+    from inograph.classes.graphs.Graph import Graph
+    from inograph.classes.graphs.Network import NetworkClass
+    network = NetworkClass(Graph)().FromTable(file)
+    return {'Edges': {link.ID: {'ID': link.ID,
+                                'Source': {'ID': link.Source.ID, 'Location': link.Source.Location},
+                                'Target': {'ID': link.Target.ID, 'Location': link.Target.Location}}
+                      for link in network.Links.values()}}
 
 
 def SaveDictToExcel(d, file):
-    pd.read_json(json.dumps(d)).to_excel(file)
+    import pandas as pd
+    pd.DataFrame(d).to_excel(file)
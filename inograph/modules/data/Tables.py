@@ -0,0 +1,79 @@
+import os
+import numpy as np
+
+# the columns of a link inventory table, one row per channel (or per link without channels). See Network.FromTable
+LinkTableColumns = {
+    'SourceLatitude': 'Site A Latitude',
+    'SourceLongitude': 'Site A Longitude',
+    'TargetLatitude': 'Site B Latitude',
+    'TargetLongitude': 'Site B Longitude',
+    'SourceID': 'Site A ID',  # optional
+    'TargetID': 'Site B ID',  # optional
+    'LinkID': 'Link ID',  # optional
+    'ChannelID': 'Channel ID',  # optional
+    'Frequency': 'Frequency',  # optional, in Ghz
+    'Bandwidth': 'Bandwidth',  # optional, in Mb
+    'TxLevel': 'TxLevel',  # optional, in DB
+    'TxGain': 'TxGain',  # optional, in DB
+    'RxGain': 'RxGain'  # optional, in DB
+}
+
+
+def ReadTable(file, **kwargs):
+    """
+    Reads a CSV, Parquet or Excel file according to its extension.
+    :param kwargs: passed to the pandas reader
+    :return: DataFrame
+    """
+    import pandas as pd
+    return __format(file, {'.csv': pd.read_csv, '.parquet': pd.read_parquet, '.xlsx': pd.read_excel, '.xls': pd.read_excel})(file, **kwargs)
+
+
+def WriteTable(table: 'pandas.DataFrame', file, **kwargs):
+    """
+    Writes a DataFrame to a CSV, Parquet or Excel file according to its extension, without the index.
+    """
+    __format(file, {'.csv': table.to_csv, '.parquet': table.to_parquet, '.xlsx': table.to_excel})(file, index=False, **kwargs)
+
+
+def SiteRows(sourceLocations, targetLocations):
+    """
+    Finds the distinct sites of a table of links by grouping their endpoints on (latitude, longitude).
+    :param sourceLocations: array of shape (links, 2)
+    :param targetLocations: array of shape (links, 2)
+    :return: (first, sources, targets) - array of the first endpoint of every distinct site, in order of first appearance,
+             as a row of the sources followed by the targets, and arrays of the site of the source and of the target of every link
+    """
+    import pandas as pd
+    locations = pd.DataFrame(np.concatenate([sourceLocations, targetLocations]), columns=['Latitude', 'Longitude'])
+    if locations.isna().any(axis=None): raise Exception("The table has links with missing locations.")
+    sites = locations.groupby(['Latitude', 'Longitude'], sort=False).ngroup().to_numpy()
+    return np.unique(sites, return_index=True)[1], sites[:len(sourceLocations)], sites[len(sourceLocations):]
+
+
+def LinkRows(sources, targets):
+    """
+    Groups the rows of a table which connect the same two sites, in either direction, into links.
+    :return: (links, first) - array of the link of every row, numbered in order of first appearance, and the first row of every link
+    """
+    import pandas as pd
+    pairs = pd.DataFrame({'A': np.minimum(sources, targets), 'B': np.maximum(sources, targets)})
+    links = pairs.groupby(['A', 'B'], sort=False).ngroup().to_numpy()
+    return links, np.unique(links, return_index=True)[1]
+
+
+def IDList(column):
+    """
+    :return: list of the IDs of a table column, None where missing. Integer IDs read as floats, as in a column with
+             missing values, are integers again
+    """
+    import pandas as pd
+    values = pd.Series(column)
+    if values.dtype.kind == 'f' and (values.dropna() % 1 == 0).all(): values = values.astype('Int64')
+    return [None if pd.isna(ID) else ID for ID in values.astype(object).tolist()]
+
+
+def __format(file, functions):
+    if (function := functions.get(os.path.splitext(str(file))[1].lower())) is None:
+        raise Exception(f"Unsupported table format {file}, use one of {', '.join(functions)}.")
+    return function
@@ -1,5 +1,4 @@
 import numpy as np
-from matplotlib import pyplot as plt
 
 
 def DrawFunction(f, xPoints):
@@ -8,6 +7,7 @@ def DrawFunction(f, xPoints):
     :param f: the function to draw (y-axis)
     :param xPoints: points along the x-axis
     """
+    from matplotlib import pyplot as plt
     x_new = np.linspace(xPoints[0], xPoints[-1], 100)
     plt.plot(x_new, f(x_new), 'b-')
     plt.show()
@@ -1,9 +1,9 @@
 import random
-import plotly
-import plotly.graph_objects as go
 
 
 def PlotGraphs(graphDicts, title='Untitled', save=None):
+    import plotly
+    import plotly.graph_objects as go
     fig = go.Figure()
     multipleGraph = len(graphDicts) >= 1
     for d in graphDicts:
@@ -0,0 +1,75 @@
+import bisect
+
+
+class FrequencyIndex:
+    """
+    Indexes frequency bands by their lower edge, answering which bands overlap a given band without scanning all of them.
+    Frequencies are in Ghz and bandwidths in Mhz, as on Channel.
+    """
+    def __init__(self):
+        self.__lows = []  # sorted [(lower edge, ID)]
+        self.__bands = {}  # {ID: (lower edge, upper edge)}
+        self.__maxBandwidth = 0
+
+    def __len__(self):
+        return len(self.__bands)
+
+    def __contains__(self, ID):
+        return ID in self.__bands
+
+    @property
+    def MaxBandwidth(self):
+        """
+        :return: the widest bandwidth ever indexed, in Mhz
+        """
+        return self.__maxBandwidth
+
+    def Insert(self, ID, frequency, bandwidth):
+        """
+        Adds a band to the index, or moves it if ID is already indexed.
+        """
+        self.Remove(ID)
+        band = self.__band(frequency, bandwidth)
+        bisect.insort(self.__lows, (band[0], ID))
+        self.__bands[ID] = band
+        self.__maxBandwidth = max(self.__maxBandwidth, bandwidth)
+
+    def InsertMany(self, bands):
+        """
+        Adds many bands at once, as .Insert would add each of them. Large batches are appended and sorted together
+        instead of being inserted one by one.
+        :param bands: iterable of (ID, frequency, bandwidth)
+        """
+        bands = {ID: (frequency, bandwidth) for ID, frequency, bandwidth in bands}
+        if len(bands) * 8 < len(self.__lows):
+            [self.Insert(ID, *band) for ID, band in bands.items()]
+            return
+        [self.Remove(ID) for ID in bands if ID in self.__bands]
+        for ID, (frequency, bandwidth) in bands.items():
+            self.__bands[ID] = band = self.__band(frequency, bandwidth)
+            self.__lows.append((band[0], ID))
+            self.__maxBandwidth = max(self.__maxBandwidth, bandwidth)
+        self.__lows.sort()
+
+    def Remove(self, ID):
+        """
+        :return: the (lower edge, upper edge) removed or None if ID is not indexed
+        """
+        if (band := self.__bands.pop(ID, None)) is None: return None
+        del self.__lows[bisect.bisect_left(self.__lows, (band[0], ID))]
+        return band
+
+    def Overlapping(self, frequency, bandwidth, *, guard: float = 0):
+        """
+        :param guard: optional, in Mhz, bands closer than guard to the band are returned as well
+        :return: IDs of the indexed bands overlapping the band, ordered by their lower edge
+        """
+        low, high = self.__band(frequency, bandwidth)
+        low, high = low - guard / 1000, high + guard / 1000
+        start = bisect.bisect_left(self.__lows, (low - self.__maxBandwidth / 1000,))
+        stop = bisect.bisect_left(self.__lows, (high,))
+        return [ID for _, ID in self.__lows[start: stop] if self.__bands[ID][1] > low]
+
+    @staticmethod
+    def __band(frequency, bandwidth):
+        return frequency - bandwidth / 2000, frequency + bandwidth / 2000
@@ -0,0 +1,79 @@
+import copy
+import numpy as np
+from inograph.modules.mathematics.InterferenceMatrix import ChannelArrays, InterferenceLevels, SignalLevels
+from inograph.modules.mathematics.RF import AggregateSINR, Capacity, DBtoMW, FrequencyRejection
+
+
+class PlanEvaluator:
+    """
+    Scores candidate frequency/power plans for a fixed set of channels.
+    The geometry of every channel pair (distances, antenna angles) does not depend on the plan, so the path loss it causes is
+    computed once. The RPF attenuation at an angle is the same number of DB for any gain, hence each plan only adds its
+    levels, gains and frequencies to the precomputed losses, masks the pairs whose bands are apart, and sums in mW together
+    with the noise floor of every channel, so a channel without interferers scores its signal to noise ratio.
+    """
+    def __init__(self, channels: ChannelArrays, *, includeSelfInterference=False, adjacentRejection: float = None,
+                 separationAngle: float = 90, beamWidth: float = 1.0):
+        """
+        :param channels: ChannelArrays of the channels, its current parameters are the default of every plan
+        :param includeSelfInterference: will include interference between channels of the same link
+        :param adjacentRejection: optional, the rejection in DB of adjacent channels. Only overlapping channels interfere if not given
+        """
+        self.__channels = channels
+        self.__adjacentRejection = adjacentRejection
+        # a 0dBm transmission at 1Ghz between 0DB antennas, on a single band, receives minus the loss of the geometry alone
+        unit = copy.copy(channels)
+        unit.TxLevel, unit.TxGain, unit.RxGain = np.zeros(len(channels)), np.zeros(len(channels)), np.zeros(len(channels))
+        unit.Frequency, unit.Bandwidth = np.ones(len(channels)), np.ones(len(channels))
+        self.__interferenceLoss = -InterferenceLevels(unit, includeSelfInterference=includeSelfInterference,
+                                                      separationAngle=separationAngle, beamWidth=beamWidth)
+        self.__signalLoss = -SignalLevels(unit)
+
+    def __len__(self):
+        return len(self.__channels)
+
+    @property
+    def Keys(self):
+        """
+        :return: the (Link.ID, Channel.ID) keys of the channels, column i of a plan describes channel Keys[i]
+        """
+        return self.__channels.Keys
+
+    def Evaluate(self, *, frequency=None, TxLevel=None, TxGain=None, RxGain=None):
+        """
+        Each parameter is an array of shape (plans, channels), or (channels,) for a value shared by all plans.
+        Parameters not given keep the current values of the channels.
+        :param frequency: in Ghz
+        :param TxLevel: in dBm
+        :param TxGain: in DB
+        :param RxGain: in DB
+        :return: (worstSINR, totalCapacity) - arrays holding, per plan, the lowest SINR of any channel and the sum of the
+                 capacities of all channels
+        """
+        plans = np.broadcast_arrays(*map(np.atleast_2d, self.__parameters(frequency, TxLevel, TxGain, RxGain)))
+        worstSINR, totalCapacity = np.empty(len(plans[0])), np.empty(len(plans[0]))
+        for i, plan in enumerate(zip(*plans)):
+            sinr = self.__sinr(*plan)
+            worstSINR[i] = sinr.min(initial=np.inf)
+            totalCapacity[i] = Capacity(DBtoMW(sinr), self.__channels.Bandwidth).sum()
+        return worstSINR, totalCapacity
+
+    def SINR(self, *, frequency=None, TxLevel=None, TxGain=None, RxGain=None):
+        """
+        :return: array of the SINR, in DB, of every channel under a single plan, given as in .Evaluate with shape (channels,)
+        """
+        return self.__sinr(*self.__parameters(frequency, TxLevel, TxGain, RxGain))
+
+    def __parameters(self, frequency, TxLevel, TxGain, RxGain):
+        return [np.asarray(getattr(self.__channels, name) if value is None else value, dtype=float)
+                for name, value in [('Frequency', frequency), ('TxLevel', TxLevel), ('TxGain', TxGain), ('RxGain', RxGain)]]
+
+    def __sinr(self, frequency, TxLevel, TxGain, RxGain):
+        bandwidth = self.__channels.Bandwidth
+        transmitted = TxLevel + TxGain - 20 * np.log10(frequency)
+        rejection = FrequencyRejection(frequency[:, None], bandwidth[:, None], frequency[None, :], bandwidth[None, :],
+                                       adjacentRejection=self.__adjacentRejection)
+        with np.errstate(invalid='ignore'):
+            levels = np.where(rejection == np.inf, -np.inf,
+                              transmitted[:, None] + RxGain[None, :] - self.__interferenceLoss - rejection)
+        return AggregateSINR(transmitted + RxGain - self.__signalLoss, DBtoMW(levels).sum(axis=0), bandwidth)
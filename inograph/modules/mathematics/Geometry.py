@@ -1,5 +1,4 @@
-from math import radians, sin, cos, asin, sqrt
-import numpy as np
+from math import radians, degrees, sin, cos, acos, asin, atan2, hypot, sqrt
 
 
 def ReverseVector(vector):
@@ -7,11 +6,10 @@ def ReverseVector(vector):
 
 
 def AngleBetweenVectors(vector1, vector2):
-    a, b = np.array(vector1), np.array(vector2)
-    norm = np.linalg.norm(a) * np.linalg.norm(b)
+    norm = hypot(*vector1) * hypot(*vector2)
     if norm == 0: return 0
-    angle = np.arccos(np.clip(np.inner(a, b) / norm, -1.0, 1.0))
-    return angle if np.cross(b, a) <= 0 else -angle
+    angle = acos(max(-1.0, min(1.0, (vector1[0] * vector2[0] + vector1[1] * vector2[1]) / norm)))
+    return angle if vector2[0] * vector1[1] - vector2[1] * vector1[0] <= 0 else -angle
 
 
 def GlobeDistance(locationA, locationB, *, radius: float = 6371.0):
@@ -24,3 +22,13 @@ def GlobeDistance(locationA, locationB, *, radius: float = 6371.0):
     lon1, lon2, lat1, lat2 = radians(locationA[0]), radians(locationB[0]), radians(locationA[1]), radians(locationB[1])
     a = sin((lon2 - lon1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lat2 - lat1) / 2) ** 2
     return 2.0 * asin(sqrt(a)) * radius
+
+
+def Bearing(locationA, locationB):
+    """
+    :param locationA: tuple latitude, longitude, as Site.Location
+    :param locationB: tuple latitude, longitude, as Site.Location
+    :return: the initial bearing, in degrees clockwise from north, of the great circle from locationA to locationB
+    """
+    lat1, lat2, dLon = radians(locationA[0]), radians(locationB[0]), radians(locationB[1] - locationA[1])
+    return degrees(atan2(sin(dLon) * cos(lat2), cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(dLon))) % 360
@@ -0,0 +1,385 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+import math
+import numpy as np
+from inograph.modules.mathematics.RF import AttenuatedLevel, AttenuationDistance, DBtoMW, FrequencyRejection
+
+# the ChannelArrays arrays read by InterferenceLevels, shared with the worker processes of TiledInterference
+__sharedArrays = ['LinkIndex', 'SourceLocations', 'TargetLocations', 'Frequency', 'Bandwidth', 'TxLevel', 'TxGain', 'RxGain']
+
+
+class ChannelArrays:
+    """
+    Packs the parameters of a list of channels into NumPy arrays for vectorized link-budget computations.
+    Row i of every array describes the channel with key Keys[i] = (Link.ID, Channel.ID). Rows can be rewritten with .Set.
+    """
+    def __init__(self, channels=()):
+        channels = list(channels)
+        self.Keys, self.Index = [], {}
+        self.__linkIndex = {}
+        self.LinkIndex = np.zeros(0, dtype=np.int64)
+        self.SourceLocations, self.TargetLocations = np.zeros((0, 2)), np.zeros((0, 2))
+        self.Frequency, self.Bandwidth = np.zeros(0), np.zeros(0)
+        self.TxLevel, self.TxGain, self.RxGain = np.zeros(0), np.zeros(0), np.zeros(0)
+        self.Resize(len(channels))
+        [self.Set(i, c) for i, c in enumerate(channels)]
+
+    def __len__(self):
+        return len(self.Keys)
+
+    def Resize(self, size):
+        """
+        Grows the arrays to size rows. New rows are empty (key None).
+        """
+        grow = size - len(self.Keys)
+        if grow <= 0: return
+        self.Keys.extend([None] * grow)
+        self.LinkIndex = np.concatenate([self.LinkIndex, np.full(grow, -1, dtype=np.int64)])
+        self.SourceLocations = np.concatenate([self.SourceLocations, np.zeros((grow, 2))])
+        self.TargetLocations = np.concatenate([self.TargetLocations, np.zeros((grow, 2))])
+        for name in ['Frequency', 'Bandwidth', 'TxLevel', 'TxGain', 'RxGain']:
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(grow)]))
+
+    def Set(self, i, channel):
+        """
+        Writes the parameters of channel into row i.
+        """
+        self.Clear(i)
+        self.Keys[i] = key = (channel.Link.ID, channel.ID)
+        self.Index[key] = i
+        self.LinkIndex[i] = self.__linkIndex.setdefault(channel.Link.ID, len(self.__linkIndex))
+        self.SourceLocations[i], self.TargetLocations[i] = channel.Source.Location, channel.Target.Location
+        self.Frequency[i], self.Bandwidth[i], self.TxLevel[i] = channel.Frequency, channel.Bandwidth, channel.TxLevel
+        self.TxGain[i], self.RxGain[i] = channel.TxGain, channel.RxGain
+
+    @staticmethod
+    def FromArrays(keys, linkIndex, sourceLocations, targetLocations, frequency, bandwidth, TxLevel, TxGain, RxGain):
+        """
+        Packs channels given by their parameters directly, without Channel objects. Row i describes the channel with key keys[i].
+        :param linkIndex: array of an integer per channel, equal for the channels of the same link
+        """
+        channels = ChannelArrays()
+        channels.Keys = list(keys)
+        channels.Index = {key: i for i, key in enumerate(channels.Keys)}
+        _, channels.LinkIndex = np.unique(np.asarray(linkIndex, dtype=np.int64), return_inverse=True)
+        channels.LinkIndex = channels.LinkIndex.astype(np.int64).reshape(-1)
+        channels.__linkIndex = {key[0]: link for key, link in zip(channels.Keys, channels.LinkIndex.tolist())}
+        channels.SourceLocations, channels.TargetLocations = np.array(sourceLocations, dtype=float), np.array(targetLocations, dtype=float)
+        channels.Frequency, channels.Bandwidth = np.array(frequency, dtype=float), np.array(bandwidth, dtype=float)
+        channels.TxLevel, channels.TxGain, channels.RxGain = np.array(TxLevel, dtype=float), np.array(TxGain, dtype=float), np.array(RxGain, dtype=float)
+        return channels
+
+    def Clear(self, i):
+        if (key := self.Keys[i]) is not None: del self.Index[key]
+        self.Keys[i] = None
+        self.LinkIndex[i] = -1
+
+
+class InterferenceStore:
+    """
+    Maintains the interference matrix of a changing set of channels, and the aggregate interference on each channel.
+    Edits only mark channels as dirty. The rows and columns of dirty channels are recomputed on the next read,
+    so an edit costs O(channels) instead of recomputing every pair.
+    """
+    def __init__(self, channels=(), *, includeSelfInterference=False, adjacentRejection: float = None):
+        self.__options = {'includeSelfInterference': includeSelfInterference, 'adjacentRejection': adjacentRejection}
+        self.__channels = ChannelArrays()
+        self.__levels = np.full((0, 0), -np.inf)  # in dBm, [origin slot][interfered slot]
+        self.__aggregate = np.zeros(0)  # in mW, per interfered slot
+        self.__free, self.__dirty = [], set()
+        [self.Add(c) for c in channels]
+
+    def __len__(self):
+        return len(self.__channels.Index)
+
+    def __contains__(self, key):
+        return key in self.__channels.Index
+
+    @property
+    def Keys(self):
+        """
+        :return: the (Link.ID, Channel.ID) keys of the stored channels
+        """
+        return list(self.__channels.Index)
+
+    def Add(self, channel):
+        """
+        Adds a channel, or refreshes it if a channel with the same key is stored.
+        """
+        if (slot := self.__channels.Index.get((channel.Link.ID, channel.ID))) is None:
+            slot = self.__free.pop() if self.__free else self.__grow()
+        self.__channels.Set(slot, channel)
+        self.__dirty.add(slot)
+
+    def Invalidate(self, channel):
+        """
+        Marks a stored channel as changed, its interference is recomputed on the next read.
+        """
+        if (slot := self.__channels.Index.get((channel.Link.ID, channel.ID))) is None: return
+        self.__channels.Set(slot, channel)
+        self.__dirty.add(slot)
+
+    def Remove(self, channel):
+        if (slot := self.__channels.Index.get((channel.Link.ID, channel.ID))) is None: return
+        with np.errstate(invalid='ignore'):
+            self.__aggregate -= self.__toMW(self.__levels[slot])
+        self.__resum(np.flatnonzero(~np.isfinite(self.__aggregate)), exclude=slot)
+        self.__levels[slot, :], self.__levels[:, slot] = -np.inf, -np.inf
+        self.__aggregate[slot] = 0
+        self.__channels.Clear(slot)
+        self.__dirty.discard(slot)
+        self.__free.append(slot)
+
+    def Level(self, originKey, interferedKey):
+        """
+        :return: the RxLevel, in dBm, of the interference of one stored channel on another
+        """
+        self.__refresh()
+        index = self.__channels.Index
+        return float(self.__levels[index[originKey], index[interferedKey]])
+
+    def Levels(self):
+        """
+        :return: (keys, matrix) in the format of Network.InterferenceMatrix
+        """
+        self.__refresh()
+        slots = list(self.__channels.Index.values())
+        return list(self.__channels.Index), self.__levels[np.ix_(slots, slots)]
+
+    def Aggregate(self, key=None):
+        """
+        :param key: optional, the (Link.ID, Channel.ID) key of a stored channel
+        :return: the total interference, in dBm, on the channel with the given key, or {key: level} of every stored channel
+        """
+        self.__refresh()
+        index = self.__channels.Index
+        with np.errstate(divide='ignore'):
+            if key is not None: return float(10 * np.log10(self.__aggregate[index[key]]))
+            return dict(zip(index, (10 * np.log10(self.__aggregate[list(index.values())])).tolist()))
+
+    def __grow(self):
+        slot, size = len(self.__channels), max(2 * len(self.__channels), 16)
+        self.__channels.Resize(size)
+        levels = np.full((size, size), -np.inf)
+        levels[:slot, :slot] = self.__levels
+        self.__levels = levels
+        self.__aggregate = np.concatenate([self.__aggregate, np.zeros(size - slot)])
+        self.__free.extend(range(size - 1, slot, -1))
+        return slot
+
+    def __refresh(self):
+        if not self.__dirty: return
+        dirty, active = np.array(sorted(self.__dirty)), np.array(list(self.__channels.Index.values()), dtype=np.int64)
+        self.__dirty = set()
+        old = self.__levels[np.ix_(dirty, active)]
+        rows = InterferenceLevels(self.__channels, dirty, active, **self.__options)
+        columns = InterferenceLevels(self.__channels, active, dirty, **self.__options)
+        self.__levels[np.ix_(dirty, active)] = rows
+        self.__levels[np.ix_(active, dirty)] = columns
+        with np.errstate(invalid='ignore'):
+            self.__aggregate[active] += (self.__toMW(rows) - self.__toMW(old)).sum(axis=0)
+        # infinite levels (co-located sites) cannot be added and removed incrementally, these columns are summed again
+        stale = ~(np.isfinite(rows) & np.isfinite(old)).all(axis=0) | ~np.isfinite(self.__aggregate[active])
+        self.__resum(np.union1d(dirty, active[stale]))
+
+    def __resum(self, slots, *, exclude=None):
+        active = [s for s in self.__channels.Index.values() if s != exclude]
+        self.__aggregate[slots] = self.__toMW(self.__levels[np.ix_(active, slots)]).sum(axis=0)
+
+    @staticmethod
+    def __toMW(levels):
+        return 10 ** (levels / 10)
+
+
+def InterferenceLevels(channels: ChannelArrays, origins=None, targets=None, *, includeSelfInterference=False,
+                       adjacentRejection: float = None, separationAngle: float = 90, beamWidth: float = 1.0,
+                       blockSize: int = 1024):
+    """
+    Vectorized equivalent of Interference(originChannel, interferedChannel).RxLevel for many channel pairs at once.
+    :param channels: ChannelArrays of the channels involved
+    :param origins: optional, indices of the interfering channels. Default is all channels
+    :param targets: optional, indices of the interfered channels. Default is all channels
+    :param includeSelfInterference: will include interference between channels of the same link
+    :param adjacentRejection: optional, the rejection in DB of adjacent channels, see RF.FrequencyRejection
+    :param blockSize: number of origin rows computed at once, bounds the memory used by temporary arrays
+    :return: matrix[o][t] - the RxLevel, in dBm, of the interference of channel origins[o] on channel targets[t].
+             Pairs which are not computed, or whose frequency bands are apart, are -inf.
+    """
+    origins = np.arange(len(channels)) if origins is None else np.asarray(origins, dtype=np.int64)
+    targets = np.arange(len(channels)) if targets is None else np.asarray(targets, dtype=np.int64)
+    levels = np.empty((len(origins), len(targets)))
+    tSource, tTarget = channels.SourceLocations[targets], channels.TargetLocations[targets]
+    tVector = tTarget - tSource
+    for start in range(0, len(origins), blockSize):
+        o = origins[start: start + blockSize]
+        oSource, oTarget = channels.SourceLocations[o], channels.TargetLocations[o]
+        vector = tTarget[None, :, :] - oSource[:, None, :]  # the vector of the interference itself
+        transmissionAngle = __anglesBetweenVectors((oTarget - oSource)[:, None, :], vector)
+        arrivalAngle = __anglesBetweenVectors(-tVector[None, :, :], -vector)
+        distance = __globeDistances(oSource[:, None, :], tTarget[None, :, :])
+        block = AttenuatedLevel(channels.TxLevel[o][:, None], channels.TxGain[o][:, None], channels.RxGain[targets][None, :],
+                                channels.Frequency[o][:, None], distance, transmissionAngle, arrivalAngle,
+                                separationAngle=separationAngle, beamWidth=beamWidth)
+        rejection = FrequencyRejection(channels.Frequency[o][:, None], channels.Bandwidth[o][:, None], channels.Frequency[targets][None, :],
+                                       channels.Bandwidth[targets][None, :], adjacentRejection=adjacentRejection)
+        with np.errstate(invalid='ignore'):
+            block = np.where(rejection == np.inf, -np.inf, block - rejection)
+        if not includeSelfInterference:
+            block[channels.LinkIndex[o][:, None] == channels.LinkIndex[targets][None, :]] = -np.inf
+        levels[start: start + len(o)] = block
+    return levels
+
+
+def AggregateInterference(channels: ChannelArrays, origins=None, targets=None, *, includeSelfInterference=False,
+                          adjacentRejection: float = None, blockSize: int = 1024, workers: int = None):
+    """
+    Sums the interference on each target channel from all origin channels, without keeping the full matrix in memory.
+    :param workers: optional, number of processes the origin channels are split across. Default is the current process only
+    :return: array of the total interference, in mW, on each channel of targets
+    """
+    origins = np.arange(len(channels)) if origins is None else np.asarray(origins, dtype=np.int64)
+    if not workers or workers < 2 or len(origins) <= blockSize:
+        return __aggregateInterference(channels, origins, targets, includeSelfInterference, adjacentRejection, blockSize)
+    with ProcessPoolExecutor(workers) as pool:
+        return sum(pool.map(__aggregateInterference, repeat(channels), np.array_split(origins, workers), repeat(targets),
+                            repeat(includeSelfInterference), repeat(adjacentRejection), repeat(blockSize)))
+
+
+def SignalLevels(channels: ChannelArrays):
+    """
+    Vectorized equivalent of Channel.RxLevel
+    :return: array of the RxLevel, in dBm, of every channel
+    """
+    distance = __globeDistances(channels.SourceLocations, channels.TargetLocations)
+    return AttenuatedLevel(channels.TxLevel, channels.TxGain, channels.RxGain, channels.Frequency, distance, 0, 0)
+
+
+def TiledInterference(channels: ChannelArrays, *, maxDistance: float = None, minLevel: float = None, includeSelfInterference=False,
+                      adjacentRejection: float = None, tileSize: float = 1.0, workers: int = None, blockSize: int = 1024,
+                      radius: float = 6371.0):
+    """
+    Finds the interfering pairs of channels tile by tile, the sparse equivalent of Network.Interferences.
+    Interfered channels are split into tiles of tileSize degrees by the location of their target site. Each tile is computed
+    against the origin channels whose source site lies within the tile grown by a halo of the interference radius - the
+    distance beyond which no interference is computed. With workers, tiles are computed in a process pool which reads the
+    channel arrays from shared memory instead of copying them to every process.
+    :param maxDistance: optional, only interference travelling at most maxDistance kilometers is computed
+    :param minLevel: optional, only interference with RxLevel of at least minLevel is returned
+    :param tileSize: the size of a tile in degrees
+    :param workers: optional, number of processes computing the tiles. Default is the current process only
+    :param radius: the radius of the sphere in kilometers. Default is the radius of the earth
+    :return: (origins, targets, levels) arrays of the interfering pairs ordered by origin then target - the interference of
+             channel origins[k] on channel targets[k] has an RxLevel of levels[k], in dBm
+    """
+    halo = maxDistance if maxDistance is not None else math.inf
+    if minLevel is not None and len(channels):
+        halo = min(halo, float(AttenuationDistance(channels.TxLevel, channels.TxGain, channels.RxGain.max(), channels.Frequency,
+                                                   minLevel).max()))
+    tiles = __tiles(channels, tileSize, halo, radius)
+    options = (maxDistance, minLevel, includeSelfInterference, adjacentRejection, blockSize)
+    if not workers or workers < 2 or len(tiles) < 2:
+        results = [__tileInterference(channels, origins, targets, *options) for origins, targets in tiles]
+    else:
+        blocks = [SharedMemory(create=True, size=max(getattr(channels, name).nbytes, 1)) for name in __sharedArrays]
+        try:
+            specs = []
+            for name, block in zip(__sharedArrays, blocks):
+                array = getattr(channels, name)
+                np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+                specs.append((name, block.name, array.shape, array.dtype.str))
+            with ProcessPoolExecutor(workers) as pool:
+                results = list(pool.map(__sharedTileInterference, repeat(specs), *zip(*tiles), *map(repeat, options)))
+        finally:
+            [(block.close(), block.unlink()) for block in blocks]
+    origins, targets, levels = (np.concatenate([r[i] for r in results]) if results else np.zeros(0) for i in range(3))
+    order = np.lexsort((targets, origins))
+    return origins[order].astype(np.int64), targets[order].astype(np.int64), levels[order]
+
+
+def __tiles(channels, tileSize, halo, radius):
+    """
+    :return: [(origins, targets)] index arrays of the origin and interfered channels of every non empty tile
+    """
+    if not len(channels): return []
+    keys, tileOf = np.unique(np.floor(channels.TargetLocations / tileSize), axis=0, return_inverse=True)
+    # as in GridIndex.Candidates, GlobeDistance scales the difference of location[1] by the cosines of both location[1]s, so
+    # only its halo is widened, by the smallest cosine in the network. Locations 360 degrees apart on an axis are near as well
+    halfAngle = halo / radius / 2
+    degrees = np.full(2, math.inf)
+    if halfAngle < math.pi / 2:
+        maxCosineCoordinate = np.abs(np.concatenate([channels.SourceLocations[:, 1], channels.TargetLocations[:, 1]])).max()
+        sine = math.sin(halfAngle) / math.cos(math.radians(min(maxCosineCoordinate, 90.0)))
+        degrees = np.array([math.degrees(2 * halfAngle), math.degrees(2 * math.asin(sine)) if sine < 1 else math.inf]) + 1e-9
+    shifted = channels.SourceLocations[None, :, :] + np.array([-360.0, 0.0, 360.0])[:, None, None]
+    tiles = []
+    for i, key in enumerate(keys):
+        low, high = key * tileSize - degrees, (key + 1) * tileSize + degrees
+        near = ((shifted >= low) & (shifted <= high)).any(axis=0).all(axis=1)
+        tiles.append((np.flatnonzero(near), np.flatnonzero(tileOf.ravel() == i)))
+    return tiles
+
+
+def __sharedTileInterference(specs, origins, targets, *options):
+    """
+    Computes a tile in a worker process over the channel arrays in shared memory.
+    """
+    blocks, channels = [], ChannelArrays()
+    try:
+        for name, blockName, shape, dtype in specs:
+            blocks.append(block := SharedMemory(name=blockName))
+            setattr(channels, name, np.ndarray(shape, dtype, buffer=block.buf))
+        return __tileInterference(channels, origins, targets, *options)
+    finally:
+        channels = None
+        [block.close() for block in blocks]
+
+
+def __tileInterference(channels, origins, targets, maxDistance, minLevel, includeSelfInterference, adjacentRejection, blockSize):
+    results = []
+    for start in range(0, len(origins), blockSize):
+        o = origins[start: start + blockSize]
+        levels = InterferenceLevels(channels, o, targets, includeSelfInterference=includeSelfInterference,
+                                    adjacentRejection=adjacentRejection, blockSize=blockSize)
+        # a pair interferes if their bands do, regardless of the level, as in Network.Interferences
+        keep = FrequencyRejection(channels.Frequency[o][:, None], channels.Bandwidth[o][:, None], channels.Frequency[targets][None, :],
+                                  channels.Bandwidth[targets][None, :], adjacentRejection=adjacentRejection) != np.inf
+        if not includeSelfInterference: keep &= channels.LinkIndex[o][:, None] != channels.LinkIndex[targets][None, :]
+        if maxDistance is not None:
+            keep &= __globeDistances(channels.SourceLocations[o][:, None, :], channels.TargetLocations[targets][None, :, :]) <= maxDistance
+        if minLevel is not None: keep &= levels >= minLevel
+        rows, columns = np.nonzero(keep)
+        results.append((o[rows], targets[columns], levels[rows, columns]))
+    return tuple(np.concatenate([r[i] for r in results]) if results else np.zeros(0) for i in range(3))
+
+
+def __aggregateInterference(channels, origins, targets, includeSelfInterference, adjacentRejection, blockSize):
+    total = 0
+    for start in range(0, len(origins), blockSize):
+        levels = InterferenceLevels(channels, origins[start: start + blockSize], targets, includeSelfInterference=includeSelfInterference,
+                                    adjacentRejection=adjacentRejection, blockSize=blockSize)
+        total = total + DBtoMW(levels).sum(axis=0)
+    return total if len(origins) else np.zeros(len(channels) if targets is None else len(targets))
+
+
+def __anglesBetweenVectors(vectors1, vectors2):
+    """
+    Broadcasting equivalent of Geometry.AngleBetweenVectors over arrays of 2d vectors (last axis).
+    """
+    norm = np.linalg.norm(vectors1, axis=-1) * np.linalg.norm(vectors2, axis=-1)
+    inner = np.sum(vectors1 * vectors2, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        angle = np.arccos(np.clip(inner / norm, -1.0, 1.0))
+    cross = vectors2[..., 0] * vectors1[..., 1] - vectors2[..., 1] * vectors1[..., 0]
+    return np.where(norm == 0, 0.0, np.where(cross <= 0, angle, -angle))
+
+
+def __globeDistances(locationsA, locationsB, radius: float = 6371.0):
+    """
+    Broadcasting equivalent of Geometry.GlobeDistance over arrays of locations (last axis).
+    """
+    lon1, lat1 = np.radians(locationsA[..., 0]), np.radians(locationsA[..., 1])
+    lon2, lat2 = np.radians(locationsB[..., 0]), np.radians(locationsB[..., 1])
+    a = np.sin((lon2 - lon1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lat2 - lat1) / 2) ** 2
+    return 2.0 * np.arcsin(np.sqrt(a)) * radius
+
@@ -1,7 +1,5 @@
 import logging
 import numpy as np
-from matplotlib import pyplot as plt
-from scipy.interpolate import InterpolatedUnivariateSpline, CubicHermiteSpline, CubicSpline
 
 numberOfInterpolationPoints = 10
 
@@ -39,6 +37,7 @@ def __interpolateMaximum(f, xPoints, yPoints, interval):
 
 
 def __cubicSplineInterpolationMaxes(xPoints, yPoints):
+    from scipy.interpolate import CubicSpline
     f = CubicSpline(xPoints, yPoints)
     fd = f.derivative()
     fdd = fd.derivative()
@@ -48,6 +47,7 @@ def __cubicSplineInterpolationMaxes(xPoints, yPoints):
 
 
 def __univariateSplineInterpolationMaxes(xPoints, yPoints):
+    from scipy.interpolate import InterpolatedUnivariateSpline
     f = InterpolatedUnivariateSpline(xPoints, yPoints, k=4)
     fd = f.derivative()
     fdd = fd.derivative()
@@ -57,6 +57,8 @@ def __univariateSplineInterpolationMaxes(xPoints, yPoints):
 
 
 def __cubicHermiteSplineInterpolationMaxes(xPoints, yPoints):
+    from matplotlib import pyplot as plt
+    from scipy.interpolate import CubicHermiteSpline
     _, axs = plt.subplots()
 
     def derivative_via_neighbors(index) -> float:
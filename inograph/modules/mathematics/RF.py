@@ -1,13 +1,24 @@
 import math
-from scipy.constants import Boltzmann as boltzmann
+import numpy as np
+
+boltzmann = 1.380649e-23  # in J/K, exact in SI as scipy.constants.Boltzmann
+
+# All functions accept scalars or NumPy arrays (broadcast against each other).
+# Scalar arguments are computed with math and return a float, array arguments return an array.
 
 
 def DBtoMW(db):
-    return 10 ** (db / 10)
+    if __isScalar(db): return 10 ** (db / 10)
+    return __result(10 ** (__asArray(db) / 10))
 
 
 def MWtoDB(mw):
-    return math.log10(mw) * 10
+    """
+    :return: the level in DB. 0mW is -inf
+    """
+    if __isScalar(mw) and mw > 0: return math.log10(mw) * 10
+    with np.errstate(divide='ignore'):
+        return __result(np.log10(__asArray(mw)) * 10)
 
 
 def RPF(gain, angle, *, separationAngle: float = 90, beamWidth: float = 1.0):
@@ -16,9 +27,13 @@ def RPF(gain, angle, *, separationAngle: float = 90, beamWidth: float = 1.0):
     :param angle: the angle compared to the signal direction
     :param separationAngle: optional, the angle where the signal strength is considered a flat 0
     :param beamWidth: optional, the beam width of the antenna. Default is 1.0
-    :return: gain, in DB, at the angle, according to an RPF of a common 1ft antenna
+    :return: gain, in DB, at the angle, according to an RPF of a common 1ft antenna. -inf beyond the separation angle
     """
-    inMW = DBtoMW(gain) / math.exp((4 / math.sqrt(2)) * ((angle / beamWidth) ** 2)) if abs(angle) < separationAngle else 0
+    if __isScalar(gain, angle):
+        return MWtoDB(DBtoMW(gain) / math.exp((4 / math.sqrt(2)) * ((angle / beamWidth) ** 2)) if abs(angle) < separationAngle else 0)
+    angle = __asArray(angle)
+    with np.errstate(over='ignore'):
+        inMW = np.where(np.abs(angle) < separationAngle, DBtoMW(gain) / np.exp((4 / math.sqrt(2)) * ((angle / beamWidth) ** 2)), 0)
     return MWtoDB(inMW)
 
 
@@ -29,7 +44,7 @@ def ReverseRPF(gain, angle, *, beamWidth: float = 1.0):
     :param beamWidth: optional, the beam width of the antenna. Default is 1.0
     :return: gain, in DB, at angle 0, according to an RPF of a common 1ft antenna
     """
-    inMW = DBtoMW(gain) * math.exp((4 / math.sqrt(2)) * ((angle / beamWidth) ** 2))
+    inMW = DBtoMW(gain) * np.exp((4 / math.sqrt(2)) * ((__asArray(angle) / beamWidth) ** 2))
     return MWtoDB(inMW)
 
 
@@ -39,9 +54,12 @@ def FSPL(frequency, TxGain, RxGain, distance):
     :param TxGain: in DB
     :param RxGain: in DB
     :param distance: in kilometers
-    :return: the Free Space Path Loss in DB
+    :return: the Free Space Path Loss in DB. -inf at distance 0
     """
-    return 20 * (math.log10(distance * frequency)) + 92.45 - TxGain - RxGain
+    if __isScalar(frequency, TxGain, RxGain, distance) and distance * frequency > 0:
+        return 20 * (math.log10(distance * frequency)) + 92.45 - TxGain - RxGain
+    with np.errstate(divide='ignore'):
+        return __result(20 * np.log10(__asArray(distance) * frequency) + 92.45 - TxGain - RxGain)
 
 
 def AttenuatedLevel(TxLevel, TxGain, RxGain, frequency, distance, angleOfTransmission, angleOfArrival, *, separationAngle: float = 90, beamWidth: float = 1.0):
@@ -49,22 +67,68 @@ def AttenuatedLevel(TxLevel, TxGain, RxGain, frequency, distance, angleOfTransmi
     return TxLevel - FSPL(frequency, rpf(TxGain, angleOfTransmission), rpf(RxGain, angleOfArrival), distance)
 
 
+def AttenuationDistance(TxLevel, TxGain, RxGain, frequency, RxLevel):
+    """
+    The inverse of AttenuatedLevel for angles 0. Since RPF only lowers gains, no signal reaches RxLevel beyond this distance.
+    :return: the distance, in kilometers, at which the signal attenuates to RxLevel
+    """
+    return __result(10 ** ((__asArray(TxLevel) + TxGain + RxGain - 92.45 - RxLevel) / 20) / frequency)
+
+
 def ReverseAttenuatedLevel(RxLevel, TxGain, RxGain, frequency, distance, angleOfTransmission, angleOfArrival, *, beamWidth: float = 1.0):
     rpf = lambda g, a: ReverseRPF(g, a, beamWidth=beamWidth)
     return RxLevel + FSPL(frequency, rpf(TxGain, angleOfTransmission), rpf(RxGain, angleOfArrival), distance)
 
 
+def FrequencyRejection(frequency1, bandwidth1, frequency2, bandwidth2, *, adjacentRejection: float = None):
+    """
+    :param frequency1: frequency of the interfering channel in Ghz
+    :param bandwidth1: bandwidth of the interfering channel in Mhz
+    :param frequency2: frequency of the interfered channel in Ghz
+    :param bandwidth2: bandwidth of the interfered channel in Mhz
+    :param adjacentRejection: optional, the rejection in DB of interference between adjacent channels
+    :return: the rejection in DB of the interference - 0 if the bands overlap, adjacentRejection if the gap between the bands
+             is smaller than bandwidth2, inf otherwise (and for adjacent channels when adjacentRejection is not given)
+    """
+    adjacent = math.inf if adjacentRejection is None else adjacentRejection
+    if __isScalar(frequency1, bandwidth1, frequency2, bandwidth2):
+        gap = round(abs(frequency1 - frequency2) * 1000 - (bandwidth1 + bandwidth2) / 2, 9)
+        return 0.0 if gap < 0 else adjacent if gap < bandwidth2 else math.inf
+    gap = np.round(np.abs(__asArray(frequency1) - frequency2) * 1000 - (__asArray(bandwidth1) + bandwidth2) / 2, 9)
+    return __result(np.where(gap < 0, 0.0, np.where(gap < bandwidth2, adjacent, math.inf)))
+
+
 def ChannelNoise(bandwidth, *, temperature: float = 25.0):
     """
     :param bandwidth: bandwidth of a channel
     :param temperature: Environmental temperature
     :return: the thermal noise of the channel in DB
     """
-    return boltzmann * temperature * bandwidth
+    return __result(boltzmann * temperature * __asArray(bandwidth))
+
+
+def NoiseLevel(bandwidth, *, temperature: float = 25.0):
+    """
+    :param bandwidth: bandwidth of a channel in Mhz
+    :param temperature: Environmental temperature
+    :return: the thermal noise floor of the channel in dBm - the ChannelNoise, in watts, over the bandwidth in hz
+    """
+    return MWtoDB(ChannelNoise(__asArray(bandwidth) * 1e6, temperature=temperature) * 1000)
 
 
 def SINR(TxLevel, interferenceLevel, bandwidth):
-    return TxLevel - interferenceLevel - ChannelNoise(bandwidth)
+    return __result(__asArray(TxLevel) - interferenceLevel - ChannelNoise(bandwidth))
+
+
+def AggregateSINR(RxLevel, interference, bandwidth):
+    """
+    :param RxLevel: the level of the received signal in dBm
+    :param interference: the sum of the interference on the channel in mW
+    :param bandwidth: bandwidth of the channel in Mhz
+    :return: the SINR in DB, the signal over the interference and the NoiseLevel summed in mW. Finite for a channel without
+             interference, whose SINR is its signal to noise ratio
+    """
+    return __result(__asArray(RxLevel) - MWtoDB(__asArray(interference) + DBtoMW(NoiseLevel(bandwidth))))
 
 
 def Capacity(SINRvalue, bandwidth):
@@ -73,4 +137,18 @@ def Capacity(SINRvalue, bandwidth):
     :param bandwidth: of the channel
     :return: capacity of the channel
     """
-    return bandwidth * math.log2(1 + SINRvalue)
+    return __result(__asArray(bandwidth) * np.log2(1 + __asArray(SINRvalue)))
+
+
+def __isScalar(*values):
+    for x in values:
+        if not isinstance(x, (int, float)): return False
+    return True
+
+
+def __asArray(x):
+    return np.asarray(x, dtype=float)
+
+
+def __result(x):
+    return float(x) if np.ndim(x) == 0 else x
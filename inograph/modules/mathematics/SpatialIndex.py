@@ -0,0 +1,85 @@
+import math
+from inograph.modules.mathematics.Geometry import GlobeDistance
+
+
+class GridIndex:
+    """
+    A uniform grid over (latitude, longitude) locations, answering radius queries without scanning every location.
+    The radius is the GlobeDistance between the locations.
+    """
+    def __init__(self, *, cellSize: float = 0.5, radius: float = 6371.0):
+        """
+        :param cellSize: the size of a grid cell in degrees
+        :param radius: the radius of the sphere in kilometers. Default is the radius of the earth
+        """
+        self.__cellSize = cellSize
+        self.__radius = radius
+        self.__cells = {}  # {(row, column): {ID: location}}
+        self.__keys = {}  # {ID: (row, column)}
+        self.__maxCosineCoordinate = 0.0  # the largest |location[1]| ever indexed, see .Candidates
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __contains__(self, ID):
+        return ID in self.__keys
+
+    def Insert(self, ID, location):
+        """
+        Adds a location to the index, or moves it if ID is already indexed.
+        """
+        self.Remove(ID)
+        key = self.__key(location)
+        self.__cells.setdefault(key, {})[ID] = location
+        self.__keys[ID] = key
+        self.__maxCosineCoordinate = max(self.__maxCosineCoordinate, abs(location[1]))
+
+    def Remove(self, ID):
+        """
+        :return: the location removed or None if ID is not indexed
+        """
+        if (key := self.__keys.pop(ID, None)) is None: return None
+        cell = self.__cells[key]
+        location = cell.pop(ID)
+        if not cell: del self.__cells[key]
+        return location
+
+    def Candidates(self, location, distance):
+        """
+        :return: {ID: location} of every indexed location in the grid cells covering the bounding box of the circle.
+        A superset of the locations within distance, use .Within for the exact set.
+        """
+        # GlobeDistance adds the difference of location[0] as is to the difference of location[1] scaled by the cosines of
+        # both location[1]s, so the range of location[1] is widened by the smallest cosine of the query and the index.
+        # Both differences are periodic, locations 360 degrees apart on an axis are covered as well
+        halfAngle = distance / self.__radius / 2
+        if halfAngle >= math.pi / 2: return {ID: loc for cell in self.__cells.values() for ID, loc in cell.items()}
+        cosine = math.cos(math.radians(min(max(abs(location[1]), self.__maxCosineCoordinate), 90.0)))
+        sine = math.sin(halfAngle) / cosine if cosine > 0 else math.inf
+        rows = self.__cellRange(location[0], math.degrees(2 * halfAngle))
+        columns = self.__cellRange(location[1], math.degrees(2 * math.asin(sine))) if sine < 1 else None
+        if rows is None or columns is None:
+            keys = [key for key in self.__cells if (rows is None or key[0] in rows) and (columns is None or key[1] in columns)]
+        else:
+            keys = [key for key in self.__cells if key[0] in rows and key[1] in columns] if len(rows) * len(columns) > len(self.__cells) \
+                else [(row, column) for row in rows for column in columns if (row, column) in self.__cells]
+        return {ID: loc for key in keys for ID, loc in self.__cells[key].items()}
+
+    def Within(self, location, distance):
+        """
+        :return: IDs of the indexed locations whose GlobeDistance from location is at most distance (kilometers)
+        """
+        return [ID for ID, loc in self.Candidates(location, distance).items()
+                if GlobeDistance(location, loc, radius=self.__radius) <= distance]
+
+    def __cellRange(self, coordinate, degrees):
+        """
+        :return: set of the cell indices of one axis within degrees of coordinate, or of coordinate +-360, None for all of them
+        """
+        degrees += 1e-9
+        if degrees >= 180.0: return None
+        return {cell for center in (coordinate - 360.0, coordinate, coordinate + 360.0)
+                for cell in range(math.floor((center - degrees) / self.__cellSize), math.floor((center + degrees) / self.__cellSize) + 1)}
+
+    def __key(self, location):
+        return math.floor(location[0] / self.__cellSize), math.floor(location[1] / self.__cellSize)
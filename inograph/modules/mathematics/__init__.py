@@ -1,3 +1,7 @@
-from Geometry import *
-from Interpolation import *
-from RF import *
\ No newline at end of file
+from .Geometry import *
+from .Interpolation import *
+from .RF import *
+from .InterferenceMatrix import *
+from .SpatialIndex import *
+from .FrequencyIndex import *
+from .FrequencyPlans import *
\ No newline at end of file
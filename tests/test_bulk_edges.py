@@ -0,0 +1,26 @@
+import pytest
+from inograph.classes.graphs.BipartiteGraph import BipartiteGraph
+from inograph.classes.edges.Edge import Edge
+from inograph.classes.vertices.Vertex import Vertex
+
+
+def bipartiteGraph():
+    g = BipartiteGraph()
+    [g.AddLeftVertex(Vertex(ID=ID)) for ID in ['l1', 'l2']]
+    [g.AddRightVertex(Vertex(ID=ID)) for ID in ['r1', 'r2']]
+    return g
+
+
+@pytest.mark.parametrize('sourceID, targetID', [('l1', 'l2'), ('r2', 'r1')])
+def test_bulk_edges_inside_a_set_are_rejected(sourceID, targetID):
+    g = bipartiteGraph()
+    with pytest.raises(Exception, match='same set'):
+        g.AddEdgesFrom([Edge(g.Vertex('l1'), g.Vertex('r1')), Edge(g.Vertex(sourceID), g.Vertex(targetID))])
+    with pytest.raises(Exception, match='same set'):
+        g.FromEdgeList(['l2', sourceID], ['r2', targetID])
+    assert not g.Edges
+
+
+def test_bulk_edges_across_the_sets_are_added():
+    g = bipartiteGraph().FromEdgeList(['l1', 'r2'], ['r1', 'l2'])
+    assert len(g.Edges) == 2 and g.AreConnected('l1', 'r1') and g.AreConnected('l2', 'r2')
@@ -0,0 +1,22 @@
+import pytest
+from inograph.algorithms.spanning.Dijkstra import Dijkstra
+from inograph.classes.graphs.Graph import Graph
+
+
+def weightedGraph():
+    g = Graph().FromEdgeList(['a', 'b', 'a'], ['b', 'c', 'c'], ids=['ab', 'bc', 'ac'])
+    for eID, weight in [('ab', 1), ('bc', 1), ('ac', 5)]: g.Edge(eID).Weight = weight
+    return g
+
+
+@pytest.mark.parametrize('backend', ['python', 'csgraph'])
+def test_weights_by_attribute_name(backend):
+    g = weightedGraph()
+    assert Dijkstra(g, [g.Vertex('a')], weights='Weight', backend=backend)['a']['c'] == ['ab', 'bc']
+
+
+@pytest.mark.parametrize('backend', ['python', 'csgraph'])
+def test_missing_weight_attribute_is_named(backend):
+    g = weightedGraph()
+    with pytest.raises(Exception, match='has no weight Nope'):
+        Dijkstra(g, [g.Vertex('a')], weights='Nope', backend=backend)
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ['pandas', 'scipy', 'matplotlib', 'plotly']
+IMPORT_BUDGET = 0.25  # seconds, the best of a few runs of `import inograph` in a fresh interpreter
+
+
+def importInFreshInterpreter():
+    """
+    :return: (seconds, loaded) - the time `import inograph` took and the heavy modules it loaded
+    """
+    code = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import inograph\n"
+            "print(time.perf_counter() - start)\n"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    seconds, loaded = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.splitlines()
+    return float(seconds), [m for m in loaded.split(',') if m]
+
+
+def test_import_does_not_load_heavy_dependencies():
+    assert importInFreshInterpreter()[1] == []
+
+
+def test_import_time_budget():
+    assert min(importInFreshInterpreter()[0] for _ in range(5)) < IMPORT_BUDGET
@@ -0,0 +1,46 @@
+import json
+from inograph.classes.graphs.Graph import Graph
+from inograph.classes.graphs.Network import NetworkClass
+from inograph.classes.vertices.Site import Site
+from inograph.classes.edges.Link import Link
+from inograph.classes.edges.Channel import Channel
+
+
+def smallNetwork():
+    network = NetworkClass(Graph)()
+    a, b, c = (network.AddSite(Site(location)) for location in [(31.0, 34.0), (31.1, 34.1), (31.2, 34.0)])
+    for source, target in [(a, b), (b, c)]:
+        link = network.AddLink(Link(source, target))
+        link.AddChannel(Channel(link, frequency=15))
+        link.AddChannel(Channel(link, frequency=18))
+    return network
+
+
+def test_channels_is_a_serializable_list():
+    network = smallNetwork()
+    assert isinstance(network.Channels, list) and len(network.Channels) == 4
+    data = network.ToDictionary(includeOnly=['Channels'], Channel=['ID', 'Frequency'])
+    assert json.loads(json.dumps(data))['Channels'] == [{'ID': c.ID, 'Frequency': c.Frequency} for c in network.Channels]
+
+
+def test_serializing_does_not_build_the_interference_store():
+    network = smallNetwork()
+    assert 'InterferenceStore' not in network.Properties()
+    limits = {'Site': ['ID'], 'Link': ['ID'], 'Channel': ['ID']}
+    list(network.IterDictionary(**limits))
+    network.ToDictionary(**limits)
+    assert network._Network__interferenceStore is None
+    assert network.InterferenceStore() is network.InterferenceStore()
+
+
+def test_channels_list_follows_the_channel_index():
+    network = smallNetwork()
+    channels = network.Channels
+    assert network.Channels is channels
+    link = next(iter(network.Links.values()))
+    added = link.AddChannel(Channel(link, frequency=23))
+    assert network.Channels is not channels and added in network.Channels and len(network.Channels) == 5
+    link.RemoveChannel(added.ID)
+    assert added not in network.Channels and len(network.Channels) == 4
+    network.RemoveLink(link.ID)
+    assert network.Channels == [channel for link in network.Links.values() for channel in link.Channels.values()]
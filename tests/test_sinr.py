@@ -0,0 +1,40 @@
+import numpy as np
+from inograph.classes.graphs.Graph import Graph
+from inograph.classes.graphs.Network import NetworkClass
+from inograph.classes.vertices.Site import Site
+from inograph.classes.edges.Link import Link
+from inograph.classes.edges.Channel import Channel
+from inograph.modules.mathematics.RF import NoiseLevel
+
+
+def isolatedNetwork():
+    """
+    Two links sharing 15Ghz, and a channel at 23Ghz which no other channel interferes with
+    """
+    network = NetworkClass(Graph)()
+    a, b, c, d = (network.AddSite(Site(location)) for location in [(31.0, 34.0), (31.1, 34.1), (31.2, 34.0), (31.3, 34.1)])
+    for source, target, frequencies in [(a, b, [15, 23]), (c, d, [15])]:
+        link = network.AddLink(Link(source, target))
+        [link.AddChannel(Channel(link, frequency=frequency)) for frequency in frequencies]
+    return network
+
+
+def test_isolated_channel_gets_its_signal_to_noise_ratio():
+    network = isolatedNetwork()
+    sinr, capacity = network.SINR(asMap=True), network.Capacity(asMap=True)
+    assert np.isfinite(list(sinr.values())).all() and np.isfinite(list(capacity.values())).all()
+    channel = next(c for c in network.Channels if c.Frequency == 23)
+    assert np.isclose(sinr[(channel.Link.ID, channel.ID)], channel.RxLevel - NoiseLevel(channel.Bandwidth))
+
+
+def test_plan_with_an_isolated_channel_ranks_by_finite_scores():
+    network = isolatedNetwork()
+    evaluator = network.PlanEvaluator()
+    sinr, capacity = network.SINR(asMap=True), network.Capacity(asMap=True)
+    current = [network.Channel(linkID, channelID).Frequency for linkID, channelID in evaluator.Keys]
+    isolated = [15, 23, 38]  # no channel shares a band with another
+    shared = [15, 15, 15]
+    worstSINR, totalCapacity = evaluator.Evaluate(frequency=np.array([current, isolated, shared]))
+    assert np.isfinite(worstSINR).all() and np.isfinite(totalCapacity).all()
+    assert np.isclose(worstSINR[0], min(sinr.values())) and np.isclose(totalCapacity[0], sum(capacity.values()))
+    assert worstSINR[1] > worstSINR[2] and totalCapacity[1] > totalCapacity[2]
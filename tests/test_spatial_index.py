@@ -0,0 +1,51 @@
+import random
+import pytest
+from inograph.classes.graphs.Graph import Graph
+from inograph.classes.graphs.Network import NetworkClass
+from inograph.classes.vertices.Site import Site
+from inograph.classes.edges.Link import Link
+from inograph.classes.edges.Channel import Channel
+from inograph.modules.mathematics.Geometry import GlobeDistance
+from inograph.modules.mathematics.SpatialIndex import GridIndex
+
+
+def randomNetwork(center, spread, *, sites=120, links=200, seed=0):
+    random.seed(seed)
+    network = NetworkClass(Graph)()
+    added = [network.AddSite(Site((center[0] + random.uniform(-spread, spread), center[1] + random.uniform(-spread, spread))))
+             for _ in range(sites)]
+    while len(network.Links) < links:
+        a, b = random.sample(added, 2)
+        if network.AreConnected(a.ID, b.ID): continue
+        link = network.AddLink(Link(a, b))
+        link.AddChannel(Channel(link, frequency=15))
+    return network
+
+
+@pytest.mark.parametrize('center', [(40, -100), (1.3, 103.8), (10, 60), (60, 10), (-70, 25), (25, 70), (10, 179.5)])
+def test_sites_near_matches_brute_force(center):
+    network = randomNetwork(center, 2.0)
+    for distance in [20, 80, 200]:
+        for site in list(network.Sites.values())[:20]:
+            expected = {s.ID for s in network.Sites.values() if GlobeDistance(site.Location, s.Location) <= distance}
+            assert {s.ID for s in network.SitesNear(site.Location, distance)} == expected
+
+
+@pytest.mark.parametrize('center', [(40, -100), (60, 10), (25, 70)])
+def test_interferences_max_distance_matches_brute_force(center):
+    network = randomNetwork(center, 1.5, sites=60, links=80)
+    everything = network.Interferences(asMap=True)
+    for distance in [30, 100]:
+        expected = {(originID, targetID) for originID, targets in everything.items() for targetID, interferences in targets.items()
+                    if interferences and GlobeDistance(network.Link(originID).Source.Location,
+                                                       network.Link(targetID).Target.Location) <= distance}
+        found = network.Interferences(asMap=True, maxDistance=distance)
+        assert {(originID, targetID) for originID, targets in found.items() for targetID, interferences in targets.items()
+                if interferences} == expected
+
+
+def test_grid_index_wraps_around_the_antimeridian():
+    index = GridIndex()
+    index.Insert('a', (179.9, 10.0))
+    index.Insert('b', (-179.9, 10.0))
+    assert set(index.Within((179.9, 10.0), 50)) == {'a', 'b'}
@@ -0,0 +1,25 @@
+import pandas as pd
+from inograph.classes.abstracts.Identifiable import Identifiable
+from inograph.modules.data.Dictionaries import ImportExcelToDictionary
+
+
+def inventory(path):
+    pd.DataFrame({'Site A Latitude': [31.0, 31.1, 31.0], 'Site A Longitude': [34.0, 34.1, 34.0],
+                  'Site B Latitude': [31.1, 31.2, 31.1], 'Site B Longitude': [34.1, 34.0, 34.1],
+                  'Frequency': [15, 15, 18]}).to_csv(path, index=False)
+    return path
+
+
+def test_import_to_dictionary_groups_sites_and_links(tmp_path):
+    data = ImportExcelToDictionary(inventory(tmp_path / 'links.csv'))
+    assert len(data['Edges']) == 2 and all(ID == edge['ID'] for ID, edge in data['Edges'].items())
+    sites = {site['ID']: site['Location'] for edge in data['Edges'].values() for site in [edge['Source'], edge['Target']]}
+    assert sorted(sites.values()) == [(31.0, 34.0), (31.1, 34.1), (31.2, 34.0)]
+
+
+def test_import_to_dictionary_uses_the_id_factory(tmp_path):
+    Identifiable.SetIDFactory(Identifiable.SequentialIDs(100))
+    try: data = ImportExcelToDictionary(inventory(tmp_path / 'links.csv'))
+    finally: Identifiable.SetIDFactory()
+    edge = next(iter(data['Edges'].values()))
+    assert all(isinstance(ID, int) for ID in [edge['ID'], edge['Source']['ID'], edge['Target']['ID']])
@@ -0,0 +1,46 @@
+import random
+import numpy as np
+import pytest
+from inograph.classes.graphs.Graph import Graph
+from inograph.classes.graphs.Network import NetworkClass
+from inograph.classes.vertices.Site import Site
+from inograph.classes.edges.Link import Link
+from inograph.classes.edges.Channel import Channel
+from inograph.modules.mathematics import InterferenceMatrix
+from inograph.modules.mathematics.InterferenceMatrix import ChannelArrays
+
+
+def spreadNetwork(center, spread, *, sites=80, links=120, seed=0):
+    random.seed(seed)
+    network = NetworkClass(Graph)()
+    added = [network.AddSite(Site((center[0] + random.uniform(-spread, spread), center[1] + random.uniform(-spread, spread))))
+             for _ in range(sites)]
+    while len(network.Links) < links:
+        a, b = random.sample(added, 2)
+        if network.AreConnected(a.ID, b.ID): continue
+        link = network.AddLink(Link(a, b))
+        link.AddChannel(Channel(link, frequency=random.choice([15, 18])))
+    return network
+
+
+def pairs(interferences):
+    return {(originID, targetID, len(found)) for originID, targets in interferences.items() for targetID, found in targets.items()}
+
+
+@pytest.mark.parametrize('center', [(35.7, 139.7), (-33.9, 151.2), (40.7, -100.0), (139.7, 35.7)])
+def test_tiles_prune_origins_beyond_90_degrees(center):
+    network = spreadNetwork(center, 4.0)
+    channels = ChannelArrays(network.Channels)
+    tiles = getattr(InterferenceMatrix, '__tiles')(channels, 1.0, 50.0, 6371.0)
+    assert len(tiles) > 1 and all(len(origins) < len(channels) for origins, _ in tiles)
+
+
+@pytest.mark.parametrize('center', [(35.7, 139.7), (-33.9, 151.2), (60.0, 10.0), (179.5, 10.0)])
+@pytest.mark.parametrize('options', [{'maxDistance': 60}, {'minLevel': -60}, {'maxDistance': 60, 'minLevel': -60}])
+def test_tiled_interferences_match_the_single_process_ones(center, options):
+    network = spreadNetwork(center, 2.0)
+    single = network.Interferences(asMap=True, **options)
+    tiled = network.Interferences(asMap=True, workers=2, **options)
+    assert single.keys() == tiled.keys() and pairs(single) == pairs(tiled)
+    levels = lambda interferences: sorted(i.RxLevel for i in interferences)
+    assert np.allclose(levels(network.Interferences(**options)), levels(network.Interferences(workers=2, **options)))